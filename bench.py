@@ -0,0 +1,527 @@
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter as tk
+from tkinter import ttk
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+import main
+
+
+def generate_entries(tickets, days, seed=1):
+    with open(main.resource_path("sample_appdata.json"), "r") as f:
+        sample = json.load(f)
+
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=days)
+    entries = []
+    for i in range(tickets):
+        created = start + timedelta(seconds=rng.randint(0, days * 86400))
+        entries.append(main.normalize_entry(dict(rng.choice(sample), timestamp=created.strftime("%m/%d/%Y %I:%M:%S %p"), title=f"{rng.choice(sample)['title']} #{i}")))
+    return entries
+
+
+def generate_archive(archive_dir, tickets, months, seed=1):
+    per_month = {}
+    for record in generate_entries(tickets, 30 * months, seed):
+        per_month.setdefault(main.backup_month(record), []).append(record)
+
+    os.makedirs(archive_dir, exist_ok=True)
+    for month, records in per_month.items():
+        main.write_partition(os.path.join(archive_dir, f"{month}.json"), records)
+    return main.archive_partitions(archive_dir)
+
+
+def bench_search(args):
+    with tempfile.TemporaryDirectory() as archive_dir:
+        partitions = generate_archive(archive_dir, args.tickets, args.months)
+        print(f"{args.tickets} tickets in {len(partitions)} monthly partitions, query {args.term!r}, {os.cpu_count()} CPUs")
+
+        start = time.perf_counter()
+        matches = sum(len(main.search_partition(path, args.term)) for path in partitions)
+        baseline = time.perf_counter() - start
+        print(f"in-process scan   {baseline * 1000:8.1f} ms  ({matches} matches)")
+
+        for workers in args.workers:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(abs, range(workers)))  # spawn the workers before timing
+                best = None
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    first = None
+                    futures = [executor.submit(main.search_partition, path, args.term) for path in partitions]
+                    for future in as_completed(futures):
+                        future.result()
+                        if first is None:
+                            first = time.perf_counter() - start
+                    total = time.perf_counter() - start
+                    if best is None or total < best[0]:
+                        best = (total, first)
+            print(f"{workers} worker(s)       {best[0] * 1000:8.1f} ms  first partial result {best[1] * 1000:6.1f} ms  speedup x{baseline / best[0]:.2f}")
+
+
+# UI event replay.
+# "ui" generates a dataset per size, then starts a fresh "ui-replay" process for
+# each one with APPDATA pointed at a temp dir, so the real TicketTrackerApp loads
+# it exactly as it would on a tech's machine. Steps are real Tk events sent with
+# `event generate`; a step's latency runs from the first event until the handlers,
+# anything they queued with after(0)/after_idle() (e.g. Treeview heading commands)
+# and the resulting redraws have all run. A 10 ms heartbeat timer measures how
+# late the event loop gets around to it, which also catches debounced work and
+# results that background threads hand back to the Tk thread.
+
+HEARTBEAT_MS = 10
+SEARCH_TERMS = ["vpn", "printer", "reset"]
+KEYSYMS = {" ": "space", "-": "minus", ".": "period", "#": "numbersign", "\r": "Return"}
+
+
+def bench_duplicates(args):
+    # Recall of the MinHash/LSH index against an exact Jaccard scan, on near-copies of
+    # generated tickets (one word replaced), plus per-query latency.
+    entries = generate_entries(args.tickets, args.days, args.seed)
+    index = main.DuplicateIndex(args.days + 1)
+    start = time.perf_counter()
+    for entry in entries:
+        index.add(entry)
+    build = time.perf_counter() - start
+    print(f"{len(index.items)} tickets indexed in {build * 1000:.0f} ms")
+
+    rng = random.Random(args.seed)
+    shingles = main.DuplicateIndex.shingles
+    latencies = []
+    expected = found = 0
+    for entry in rng.sample(entries, args.queries):
+        words = main.DuplicateIndex.entry_text(entry).split()
+        words[rng.randrange(len(words))] = f"changed{rng.randrange(1 << 30)}"
+        text = " ".join(words)
+
+        start = time.perf_counter()
+        matches = index.query(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        query = shingles(text)
+        if not query:
+            continue
+        if any(len(query & other) / len(query | other) >= main.DuplicateIndex.THRESHOLD for _, other, _, _, _ in index.items.values()):
+            expected += 1
+            found += bool(matches)
+
+    stats = summarize(latencies)
+    print(f"recall: {found}/{expected} queries with a duplicate over {main.DuplicateIndex.THRESHOLD} found ({found / max(1, expected):.1%})")
+    print(f"query ms: p50 {stats['p50']:.3f}  p90 {stats['p90']:.3f}  p99 {stats['p99']:.3f}  max {stats['max']:.3f}")
+
+
+def percentile(sorted_values, pct):
+    return sorted_values[max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(values):
+    values = sorted(values)
+    return {"n": len(values), "p50": percentile(values, 50), "p90": percentile(values, 90),
+            "p99": percentile(values, 99), "max": values[-1]}
+
+
+def click(widget, x, y, button=1):
+    return [{"widget": widget, "event": f"<ButtonPress-{button}>", "x": x, "y": y},
+            {"widget": widget, "event": f"<ButtonRelease-{button}>", "x": x, "y": y}]
+
+
+def click_item(widget, item, column, modifier=""):
+    # Treeview row positions depend on scrolling, so they're resolved when the step runs.
+    return [{"widget": widget, "event": f"<{modifier}ButtonPress-1>", "item": item, "column": column},
+            {"widget": widget, "event": f"<{modifier}ButtonRelease-1>", "item": item, "column": column}]
+
+
+def find_button(parent, text):
+    for child in parent.winfo_children():
+        if isinstance(child, ttk.Button) and child.cget("text") == text:
+            return child
+        found = find_button(child, text)
+        if found is not None:
+            return found
+    return None
+
+
+def default_scenario(app, args):
+    tree = app.tree
+    rows = tree.get_children()
+    visible = [iid for iid in rows[:20] if tree.bbox(iid, "#1")]
+    if not visible:
+        sys.exit("ui-replay: no rows visible in the table")
+    steps = []
+
+    # Done checkbox: click the first visible rows, twice each, so the data ends as it started.
+    for i in range(args.toggles):
+        x, y, w, h = tree.bbox(visible[(i // 2) % len(visible)], "#1")
+        steps.append({"label": "toggle_done", "events": click(str(tree), x + w // 2, y + h // 2)})
+
+    # Search only runs on Return, so one step covers typing the term through the results showing.
+    search = str(app.search_entry)
+    clear = str(find_button(app.search_section, "✕"))
+    for term in args.terms:
+        keys = [{"widget": search, "event": "<KeyPress>", "keysym": KEYSYMS.get(ch, ch)} for ch in term + "\r"]
+        steps.append({"label": "search", "events": keys})
+        steps.append({"label": "search_clear", "events": click(clear, 5, 5)})
+
+    # Column sort: press/release on the Timestamp heading, twice to flip and restore the order.
+    heading_x = tree.column("#1", "width") + tree.column("#2", "width") // 2
+    for _ in range(2):
+        steps.append({"label": "sort_column", "events": click(str(tree), heading_x, 8)})
+
+    # Edit dialog on a selection of N rows: click the first row, Shift+click row N (scrolled
+    # into view) for a range selection, then Edit. Shift+Down isn't used: on Tk 8.6.13 the
+    # Treeview class binding replaces the selection before the app's handler extends it.
+    edit = str(find_button(app.search_section, "Edit"))
+    for count in args.edit_rows:
+        count = min(count, len(rows))
+        steps.append({"label": "select_row", "events": click_item(str(tree), rows[0], "#3")})
+        if count > 1:
+            steps.append({"label": "extend_selection", "events": click_item(str(tree), rows[count - 1], "#3", modifier="Shift-")})
+        steps.append({"label": f"open_edit ({count} rows)", "expect_selection": {"widget": str(tree), "count": count},
+                      "events": click(edit, 5, 5)})
+        steps.append({"label": "close_edit", "close_dialogs": True})
+    return steps
+
+
+class EventReplay:
+    def __init__(self, root, steps, stall_ms, delay_ms, settle_ms, on_finish):
+        self.root = root
+        self.steps = steps
+        self.stall_ms = stall_ms
+        self.delay_ms = delay_ms
+        self.settle_ms = settle_ms
+        self.on_finish = on_finish
+        self.latencies = {}
+        self.stalls = []
+        self.label = "startup"
+        self.expected = time.perf_counter() + HEARTBEAT_MS / 1000
+        self.root.after(HEARTBEAT_MS, self.heartbeat)
+
+    def heartbeat(self):
+        now = time.perf_counter()
+        late = (now - self.expected) * 1000
+        if late > self.stall_ms:
+            self.stalls.append({"ms": round(late, 1), "during": self.label})
+        self.expected = now + HEARTBEAT_MS / 1000
+        self.root.after(HEARTBEAT_MS, self.heartbeat)
+
+    def send(self, event):
+        path = event["widget"]
+        if not int(self.root.tk.call("winfo", "exists", path)):
+            raise RuntimeError(f"widget {path} does not exist (was the script recorded against another version?)")
+        options = []
+        if "Key" in event["event"]:
+            if self.root.tk.call("focus") != path:
+                self.root.tk.call("focus", "-force", path)
+            options += ["-keysym", event["keysym"]]
+        elif "item" in event:
+            self.root.tk.call(path, "see", event["item"])
+            self.root.update_idletasks()
+            x, y, w, h = self.root.tk.splitlist(self.root.tk.call(path, "bbox", event["item"], event["column"]))
+            options += ["-x", int(x) + int(w) // 2, "-y", int(y) + int(h) // 2]
+        else:
+            options += ["-x", event["x"], "-y", event["y"]]
+        if event.get("state"):
+            options += ["-state", event["state"]]
+        # Called directly (not via Misc.event_generate) so recorded paths of Tk-internal
+        # widgets such as combobox popdowns replay too.
+        self.root.tk.call("event", "generate", path, event["event"], *options)
+
+    def run(self, index=0):
+        if index == len(self.steps):
+            self.label = "after replay"
+            self.root.after(self.settle_ms, self.on_finish)
+            return
+
+        step = self.steps[index]
+        self.label = step["label"]
+        expected = step.get("expect_selection")
+        if expected:
+            selected = len(self.root.tk.splitlist(self.root.tk.call(expected["widget"], "selection")))
+            if selected != expected["count"]:
+                raise RuntimeError(f"step {step['label']!r} expected {expected['count']} selected rows, found {selected}")
+
+        start = time.perf_counter()
+        if step.get("close_dialogs"):
+            # Escape closes the edit dialog the way a user would; anything that ignores it is destroyed.
+            for child in self.root.winfo_children():
+                if isinstance(child, tk.Toplevel) and child.winfo_viewable():
+                    self.root.tk.call("focus", "-force", str(child))
+                    self.root.tk.call("event", "generate", str(child), "<KeyPress>", "-keysym", "Escape")
+                    if child.winfo_exists() and child.winfo_viewable():
+                        child.destroy()
+        else:
+            for event in step["events"]:
+                self.send(event)
+        self.root.update()
+        self.latencies.setdefault(step["label"], []).append((time.perf_counter() - start) * 1000)
+        self.root.after(step.get("delay", self.delay_ms), self.run, index + 1)
+
+
+class EventRecorder:
+    # A "Recorder" bindtag goes in front of every widget's tags (re-applied to new
+    # widgets every 200 ms) so it sees events before any binding can "break" them.
+    TAG = "Recorder"
+
+    def __init__(self, root):
+        self.root = root
+        self.steps = []
+        self.last = time.perf_counter()
+        for sequence in ("<ButtonPress>", "<ButtonRelease>", "<KeyPress>"):
+            root.bind_class(self.TAG, sequence, self.record, add="+")
+        self.tag_widgets()
+
+    def tag_widgets(self):
+        pending = [self.root]
+        while pending:
+            widget = pending.pop()
+            tags = widget.bindtags()
+            if tags[0] != self.TAG:
+                widget.bindtags((self.TAG,) + tags)
+            pending.extend(widget.winfo_children())
+        self.root.after(200, self.tag_widgets)
+
+    def record(self, event):
+        now = time.perf_counter()
+        path = str(event.widget)
+        kind = "KeyPress" if event.type == tk.EventType.KeyPress else event.type.name
+        recorded = {"widget": path, "event": f"<{kind}>" if kind == "KeyPress" else f"<{kind}-{event.num}>", "state": event.state}
+        if kind == "KeyPress":
+            recorded["keysym"] = event.keysym
+        else:
+            recorded["x"], recorded["y"] = event.x, event.y
+        if self.steps:
+            self.steps[-1]["delay"] = max(1, round((now - self.last) * 1000))
+        label = f"{self.root.tk.call('winfo', 'class', path)} {recorded['event']}"
+        self.steps.append({"label": label, "events": [recorded]})
+        self.last = now
+
+    def save(self, path, tickets, seed):
+        with open(path, "w") as f:
+            json.dump({"tickets": tickets, "seed": seed, "steps": self.steps}, f, indent=1)
+        print(f"Recorded {len(self.steps)} events to {path}")
+
+
+def replay_ui(args):
+    # Runs inside the child process; APPDATA already points at the generated dataset.
+    start = time.perf_counter()
+    root = tk.Tk()
+    app = main.TicketTrackerApp(root)
+    root.update_idletasks()
+    startup = {"window_ms": (time.perf_counter() - start) * 1000}
+
+    if args.record:
+        recorder = EventRecorder(root)
+
+        def close():
+            recorder.save(args.record, args.tickets, args.seed)
+            app.on_close()
+
+        root.protocol("WM_DELETE_WINDOW", close)
+        root.mainloop()
+        return
+
+    script = None
+    if args.script:
+        with open(args.script, "r") as f:
+            script = json.load(f)
+
+    def finish():
+        result = {
+            "startup": startup,
+            "interactions": {label: summarize(values) for label, values in replay.latencies.items()},
+            "stalls": replay.stalls,
+        }
+        with open(args.result, "w") as f:
+            json.dump(result, f)
+        if app.executor is not None:
+            app.executor.shutdown(wait=False, cancel_futures=True)
+        root.destroy()
+
+    def wait_until_loaded():
+        if not app.loaded:
+            root.after(20, wait_until_loaded)
+            return
+        startup["loaded_ms"] = (time.perf_counter() - start) * 1000
+        root.after(args.settle_ms, start_replay)
+
+    def start_replay():
+        replay.steps = script["steps"] if script else default_scenario(app, args)
+        replay.run()
+
+    replay = EventReplay(root, [], args.stall_ms, args.delay_ms, args.settle_ms, finish)
+    root.after_idle(wait_until_loaded)
+    root.mainloop()
+
+
+def start_xvfb():
+    if not sys.platform.startswith("linux") or os.environ.get("DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        sys.exit("bench ui needs a display: set DISPLAY or install Xvfb")
+
+    read_fd, write_fd = os.pipe()
+    server = subprocess.Popen(["Xvfb", "-displayfd", str(write_fd), "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                              pass_fds=(write_fd,), stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        display = f.readline().strip()
+    if not display:
+        server.kill()
+        sys.exit("Xvfb failed to start")
+    os.environ["DISPLAY"] = f":{display}"
+    return server
+
+
+def run_replay_process(tickets, args, result_path=None):
+    with tempfile.TemporaryDirectory() as appdata:
+        data_dir = os.path.join(appdata, main.APP_NAME)
+        os.makedirs(data_dir)
+        main.write_json_atomic(os.path.join(data_dir, "appdata.json"), generate_entries(tickets, args.days, args.seed))
+        # Defaults, never this machine's settings.json: a replay must not sync generated tickets to a real team server.
+        settings = dict(main.default_settings(), reminders_enabled=False, ticket_reminders_enabled=False, sync_enabled=False)
+        main.write_json_atomic(os.path.join(data_dir, "settings.json"), settings, indent=2)
+
+        command = [sys.executable, os.path.abspath(__file__), "ui-replay", "--tickets", str(tickets), "--seed", str(args.seed),
+                   "--stall-ms", str(args.stall_ms), "--settle-ms", str(args.settle_ms), "--delay-ms", str(args.delay_ms),
+                   "--toggles", str(args.toggles), "--terms", *args.terms, "--edit-rows", *map(str, args.edit_rows)]
+        if args.script:
+            command += ["--script", os.path.abspath(args.script)]
+        if args.record:
+            command += ["--record", os.path.abspath(args.record)]
+        if result_path:
+            command += ["--result", result_path]
+        subprocess.run(command, env=dict(os.environ, APPDATA=appdata), check=True, timeout=args.timeout)
+
+
+def print_ui_result(tickets, result, stall_ms):
+    startup = result["startup"]
+    print(f"\n{tickets} tickets: window {startup['window_ms']:.0f} ms, loaded {startup['loaded_ms']:.0f} ms")
+    print(f"  {'interaction':<26}{'n':>5}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)")
+    for label, stats in result["interactions"].items():
+        print(f"  {label:<26}{stats['n']:>5}{stats['p50']:>9.1f}{stats['p90']:>9.1f}{stats['p99']:>9.1f}{stats['max']:>9.1f}")
+    stalls = result["stalls"]
+    if stalls:
+        worst = max(stalls, key=lambda s: s["ms"])
+        print(f"  event loop stalls > {stall_ms} ms: {len(stalls)}, total {sum(s['ms'] for s in stalls):.0f} ms, worst {worst['ms']:.0f} ms during {worst['during']}")
+    else:
+        print(f"  no event loop stalls > {stall_ms} ms")
+
+
+def compare_ui_results(results, baseline, tolerance, floor_ms=5):
+    # A regression is a p90 (or load time) more than `tolerance` times the baseline
+    # and at least `floor_ms` slower, so sub-millisecond noise doesn't fail a run.
+    regressions = []
+    for tickets, result in results.items():
+        base = baseline.get(tickets)
+        if base is None:
+            continue
+        pairs = [("loaded", base["startup"]["loaded_ms"], result["startup"]["loaded_ms"])]
+        for label, stats in result["interactions"].items():
+            if label in base["interactions"]:
+                pairs.append((label, base["interactions"][label]["p90"], stats["p90"]))
+        for label, before, after in pairs:
+            if after > before * tolerance and after - before > floor_ms:
+                regressions.append(f"{tickets} tickets, {label}: {before:.1f} -> {after:.1f} ms")
+    return regressions
+
+
+def bench_ui(args):
+    if args.script:
+        with open(args.script, "r") as f:
+            script = json.load(f)
+        args.tickets, args.seed = [script["tickets"]], script["seed"]
+
+    xvfb = start_xvfb()
+    try:
+        if args.record:
+            print(f"Recording against {args.tickets[0]} tickets; close the window to save {args.record}")
+            run_replay_process(args.tickets[0], args)
+            return
+
+        results = {}
+        with tempfile.TemporaryDirectory() as scratch:
+            for tickets in args.tickets:
+                result_path = os.path.join(scratch, f"{tickets}.json")
+                run_replay_process(tickets, args, result_path)
+                with open(result_path, "r") as f:
+                    results[str(tickets)] = json.load(f)
+                print_ui_result(tickets, results[str(tickets)], args.stall_ms)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=1)
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare_ui_results(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+def add_ui_arguments(parser):
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--stall-ms", type=int, default=50, help="Heartbeat lateness that counts as a stall")
+    parser.add_argument("--settle-ms", type=int, default=2000, help="Idle time after loading and after the last event")
+    parser.add_argument("--delay-ms", type=int, default=50, help="Pause between scripted steps")
+    parser.add_argument("--toggles", type=int, default=20)
+    parser.add_argument("--terms", nargs="+", default=SEARCH_TERMS)
+    parser.add_argument("--edit-rows", type=int, nargs="+", default=[1, 50])
+    parser.add_argument("--script", help="Replay a recorded event script instead of the built-in scenario")
+    parser.add_argument("--record", help="Open the app on a generated dataset and record your events to this file")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ticket Tracker benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search_parser = commands.add_parser("search", help="Archive search fan-out across worker processes")
+    search_parser.add_argument("--tickets", type=int, default=200000)
+    search_parser.add_argument("--months", type=int, default=36)
+    search_parser.add_argument("--term", default="vpn")
+    search_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    search_parser.add_argument("--repeat", type=int, default=3)
+
+    duplicates_parser = commands.add_parser("duplicates", help="Duplicate detection recall against an exact scan, and query latency")
+    duplicates_parser.add_argument("--tickets", type=int, default=20000)
+    duplicates_parser.add_argument("--days", type=int, default=30)
+    duplicates_parser.add_argument("--queries", type=int, default=500)
+    duplicates_parser.add_argument("--seed", type=int, default=1)
+
+    ui_parser = commands.add_parser("ui", help="Replay UI events against a real app and report latency percentiles and stalls")
+    ui_parser.add_argument("--tickets", type=int, nargs="+", default=[1000, 10000, 50000])
+    ui_parser.add_argument("--days", type=int, default=365)
+    ui_parser.add_argument("--save", help="Write the results as JSON (e.g. to use as a baseline)")
+    ui_parser.add_argument("--baseline", help="Fail if p90 latencies regress against this saved result")
+    ui_parser.add_argument("--tolerance", type=float, default=1.25)
+    ui_parser.add_argument("--timeout", type=int, default=900, help="Seconds before a replay process is killed")
+    add_ui_arguments(ui_parser)
+
+    replay_parser = commands.add_parser("ui-replay", help="Run a single replay in this process (started by \"ui\")")
+    replay_parser.add_argument("--tickets", type=int, required=True)
+    replay_parser.add_argument("--result")
+    add_ui_arguments(replay_parser)
+
+    args = parser.parse_args()
+    if args.command == "search":
+        bench_search(args)
+    elif args.command == "duplicates":
+        bench_duplicates(args)
+    elif args.command == "ui":
+        bench_ui(args)
+    elif args.command == "ui-replay":
+        replay_ui(args)
@@ -5,24 +5,65 @@ import json
 import os
 import threading
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import csv
-import winsound
+try:
+    import winsound
+except ImportError:  # not on Windows; sounds are skipped
+    winsound = None
 import sys
 import requests
 import tempfile
 import subprocess
+import uuid
+import argparse
+import heapq
+import bisect
+import socket
+import secrets
+import hmac
+import struct
+import mmap
+import hashlib
+import zlib
+import glob
+import queue
+import shutil
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import re
+import itertools
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 
 APP_NAME = "Ticket Tracker"
-APPDATA_DIR = os.path.join(os.getenv("APPDATA"), APP_NAME)
+APPDATA_DIR = os.path.join(os.getenv("APPDATA") or os.path.join(os.path.expanduser("~"), ".config"), APP_NAME)
 
 os.makedirs(APPDATA_DIR, exist_ok=True)
 
 DATA_FILE = os.path.join(APPDATA_DIR, "appdata.json")
 SETTINGS_FILE = os.path.join(APPDATA_DIR, "settings.json")
+SYNC_STATE_FILE = os.path.join(APPDATA_DIR, "sync_state.json")
+TEAM_LOG_FILE = os.path.join(APPDATA_DIR, "team_log.jsonl")
+ROLLUP_FILE = os.path.join(APPDATA_DIR, "rollups.json")
+IPC_FILE = os.path.join(APPDATA_DIR, "ipc.json")
+SNAPSHOT_FILE = os.path.join(APPDATA_DIR, "appdata.snapshot")
+ARCHIVE_DIR = os.path.join(APPDATA_DIR, "archive")
+BACKUP_DIR = os.path.join(APPDATA_DIR, "backups")
+ARCHIVED_IDS_FILE = "archived_ids.txt"  # in ARCHIVE_DIR; one id per line, appended on every archive run
+ARCHIVE_BACKUP_PREFIX = "archive/"  # backup manifest keys for archive partitions
 
 STATES = ["New", "In Progress", "On Hold", "Resolved", "Cancelled"]
+AUTOCOMPLETE_FIELDS = ["caller", "title", "assignment_group"]
+TICKET_FIELDS = ["timestamp", "caller", "title", "description", "additional_notes", "assignment_group", "state", "done"]
+
+DEFAULT_SYNC_PORT = 8765
+DEFAULT_IPC_PORT = 47321
+IPC_REPLY_TIMEOUT = 5  # seconds the app waits for the Tk thread before giving up on a request
+IPC_STARTUP_WAIT = 60  # seconds a launch or quick-add keeps trying while another instance starts up
+
+DEFAULT_TICKET_REMINDER_MINUTES = {"New": 120, "In Progress": 240, "On Hold": 480}
 
 
 APP_VERSION = "1.0.0"
@@ -37,6 +78,18 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def set_window_icon(window):
+    try:
+        window.iconbitmap(resource_path("sntt.ico"))
+    except tk.TclError:
+        pass  # .ico icons only load on Windows
+
+
+def play_system_sound(alias):
+    if winsound is not None:
+        winsound.PlaySound(alias, winsound.SND_ALIAS)
+
+
 def auto_update():
     try:
         response = requests.get(VERSION_CHECK_URL, timeout=5, verify=False)
@@ -64,10 +117,1650 @@ def auto_update():
         messagebox.showerror("Update Error", f"Failed to check for updates:\n{e}")
 
 
+def normalize_entry(e):
+    timestamp = e.get("timestamp", "")
+    try:
+        dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+        timestamp = dt.strftime("%m/%d/%Y %I:%M:%S %p")
+    except:
+        pass
+    return {
+        "id": e.get("id") or uuid.uuid4().hex,
+        "rev": e.get("rev", 0),
+        "modified_by": e.get("modified_by", ""),
+        "timestamp": timestamp,
+        "caller": e.get("caller", ""),
+        "title": e.get("title", ""),
+        "description": e.get("description", ""),
+        "additional_notes": e.get("additional_notes", ""),
+        "assignment_group": e.get("assignment_group", ""),
+        "state": e.get("state", "New"),
+        "done": e.get("done", False),
+        "done_at": e.get("done_at", "")
+    }
+
+
+def write_json_atomic(path, data, indent=None):
+    # A crash or full disk mid-write leaves the old file in place, never a truncated one.
+    # Returns (file_signature, SHA-1) of exactly what was written, for stamping derived files.
+    tmp_path = path + ".tmp"
+    payload = json.dumps(data, indent=indent).encode("utf-8")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    signature = file_signature(tmp_path)  # a rename keeps size and mtime
+    os.replace(tmp_path, path)
+    return signature, hashlib.sha1(payload).digest()
+
+
+def read_entries(path):
+    # Raises ValueError (JSONDecodeError included) when the file is unreadable, so
+    # callers can't mistake a damaged file for an empty history.
+    if not os.path.exists(path):
+        return []
+
+    with open(path, "r") as f:
+        raw_entries = json.load(f)
+    if not isinstance(raw_entries, list) or not all(isinstance(e, dict) for e in raw_entries):
+        raise ValueError(f"{path} does not contain a list of tickets")
+
+    entries = []
+    seen_ids = set()
+    for e in raw_entries:
+        entry = normalize_entry(e)
+        if entry["id"] in seen_ids:
+            entry["id"] = uuid.uuid4().hex
+        seen_ids.add(entry["id"])
+        entries.append(entry)
+    return entries
+
+
+def backup_month(entry):
+    created = parse_timestamp(entry["timestamp"])
+    return created.strftime("%Y-%m") if created != datetime.min else "unknown"
+
+
+class BackupStore:
+    # Content-addressed backups. Tickets are chunked by creation month, so a
+    # generation only writes the months that changed. Every generation is a small
+    # manifest mapping month -> chunk digest. A chunk is the zlib-compressed JSON of
+    # that month's tickets, stored under its SHA-256 and verified on restore.
+    def __init__(self, backup_dir, keep=10):
+        self.chunk_dir = os.path.join(backup_dir, "chunks")
+        self.generation_dir = os.path.join(backup_dir, "generations")
+        self.keep = keep
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        os.makedirs(self.generation_dir, exist_ok=True)
+        self.current = {}  # month -> digest in the newest generation
+        self.source = None  # file_signature of appdata.json the newest generation matches, if known
+        generations = self.generations()
+        if generations:
+            try:
+                manifest = self.read_manifest(generations[0])
+                self.current = manifest["months"]
+                self.source = manifest.get("source")
+            except (OSError, ValueError, KeyError):
+                pass
+
+    def generations(self):
+        return sorted(glob.glob(os.path.join(self.generation_dir, "*.json")), reverse=True)
+
+    def read_manifest(self, path):
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def chunk_path(self, digest):
+        return os.path.join(self.chunk_dir, digest[:2], digest)
+
+    def write_generation(self, changed_months, source=None):
+        # source: signature of the data file these months now match; None leaves it as it was.
+        source = self.source if source is None else source
+        months = dict(self.current)
+        for month, records in changed_months.items():
+            if not records:
+                months.pop(month, None)
+                continue
+            data = json.dumps(sorted(records, key=lambda r: r["id"]), separators=(",", ":")).encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()
+            path = self.chunk_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(zlib.compress(data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            months[month] = digest
+
+        if months == self.current and source == self.source and self.generations():
+            return None
+
+        name = os.path.join(self.generation_dir, f"{time.time_ns()}.json")
+        write_json_atomic(name, {"created": datetime.now().strftime("%m/%d/%Y %I:%M:%S %p"), "months": months, "source": source})
+        self.current = months
+        self.source = source
+        self.prune()
+        return name
+
+    def write_all(self, entries, source):
+        # Bring the backup in line with a whole ticket file, dropping months it no longer has.
+        changed_months = {}
+        for entry in entries:
+            changed_months.setdefault(backup_month(entry), []).append(entry)
+        for month in self.current:
+            if month not in changed_months and not month.startswith(ARCHIVE_BACKUP_PREFIX):
+                changed_months[month] = []
+        return self.write_generation(changed_months, source)
+
+    def prune(self):
+        generations = self.generations()
+        for path in generations[self.keep:]:
+            os.remove(path)
+
+        referenced = set()
+        for path in generations[:self.keep]:
+            try:
+                referenced.update(self.read_manifest(path)["months"].values())
+            except (OSError, ValueError, KeyError):
+                continue
+        for path in glob.glob(os.path.join(self.chunk_dir, "*", "*")):
+            if os.path.basename(path) not in referenced:
+                os.remove(path)
+
+    def read_chunk(self, digest):
+        with open(self.chunk_path(digest), "rb") as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"chunk {digest} failed its checksum")
+        return json.loads(data)
+
+    def restore_newest_valid(self):
+        # Returns (live entries, created, {archive month: records}).
+        for path in self.generations():
+            try:
+                manifest = self.read_manifest(path)
+                entries = []
+                archive = {}
+                for month, digest in manifest["months"].items():
+                    if month.startswith(ARCHIVE_BACKUP_PREFIX):
+                        archive[month[len(ARCHIVE_BACKUP_PREFIX):]] = self.read_chunk(digest)
+                    else:
+                        entries.extend(self.read_chunk(digest))
+                return [normalize_entry(e) for e in entries], manifest.get("created", ""), archive
+            except (OSError, ValueError, KeyError, zlib.error) as e:
+                print(f"[Backup] Skipping damaged generation {os.path.basename(path)}: {e}")
+        return None, None, {}
+
+
+def entry_matches(entry, term):
+    for field in TICKET_FIELDS:
+        value = entry.get(field, "")
+        if isinstance(value, bool):
+            val_str = "☑" if value else "☐"
+        else:
+            val_str = str(value)
+        if term in val_str.lower():
+            return True
+    return False
+
+
+def archive_partitions(archive_dir=ARCHIVE_DIR):
+    # One file per month (YYYY-MM.json); newest first so recent results stream in first.
+    return sorted(glob.glob(os.path.join(archive_dir, "*.json")), reverse=True)
+
+
+def read_partition(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_partition(path, records):
+    write_json_atomic(path, records)
+
+
+def read_archive_entries(archive_dir=ARCHIVE_DIR):
+    records = []
+    for path in archive_partitions(archive_dir):
+        try:
+            records.extend(normalize_entry(r) for r in read_partition(path))
+        except (OSError, ValueError) as e:
+            print(f"[Archive] Skipping unreadable {os.path.basename(path)}: {e}")
+    return records
+
+
+def read_archived_ids(archive_dir=ARCHIVE_DIR):
+    path = os.path.join(archive_dir, ARCHIVED_IDS_FILE)
+    if not os.path.exists(path):
+        return set()
+    with open(path, "r") as f:
+        return set(line.strip() for line in f if line.strip())
+
+
+# The two functions below run in ProcessPoolExecutor workers.
+
+def search_partition(path, term):
+    return [r for r in read_partition(path) if entry_matches(r, term)]
+
+
+def export_partition(path, out_path):
+    records = read_partition(path)
+    with open(out_path, "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=TICKET_FIELDS, extrasaction="ignore")
+        for record in records:
+            writer.writerow(record)
+    return out_path
+
+
+def record_fingerprint(record):
+    return (record.get("rev", 0), record.get("modified_by", ""), record.get("done_at", "")) + tuple(record.get(field) for field in TICKET_FIELDS)
+
+
+def entry_row_values(entry):
+    return (
+        "☑" if entry.get("done") else "☐",
+        entry["timestamp"],
+        entry["caller"],
+        entry["title"],
+        entry["description"],
+        entry["additional_notes"],
+        entry["assignment_group"],
+        entry["state"]
+    )
+
+
+def file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def parse_timestamp(timestamp):
+    try:
+        return datetime.strptime(timestamp, "%m/%d/%Y %I:%M:%S %p")
+    except:
+        return datetime.min
+
+
+def record_version(record):
+    return (record.get("rev", 0), record.get("modified_by", ""))
+
+
+def resolve_conflict(local, remote):
+    # Highest revision wins; ties fall back to the client id so every replica
+    # (and the server) picks the same record without talking to each other.
+    return remote if record_version(remote) > record_version(local) else local
+
+
+def valid_sync_record(record):
+    if not isinstance(record, dict) or not isinstance(record.get("id"), str):
+        return False
+    # record_version compares (rev, modified_by) against stored records, so both must have the
+    # types every other record has (bool is an int subclass, but not a revision).
+    rev = record.get("rev", 0)
+    if not isinstance(rev, int) or isinstance(rev, bool) or not isinstance(record.get("modified_by", ""), str):
+        return False
+    # Tombstones carry no ticket fields; live tickets need a timestamp the app can sort by.
+    return bool(record.get("deleted")) or parse_timestamp(record.get("timestamp")) != datetime.min
+
+
+def collect_outgoing(entries, tombstones, dirty_ids, full):
+    # Copies only, so the sync worker never touches live entries.
+    if full:
+        return [dict(e) for e in entries] + [dict(t) for t in tombstones.values()]
+    by_id = {e["id"]: e for e in entries}
+    outgoing = []
+    for entry_id in dirty_ids:
+        record = by_id.get(entry_id) or tombstones.get(entry_id)
+        if record is not None:
+            outgoing.append(dict(record))
+    return outgoing
+
+
+def merge_file_records(local, records, base):
+    # Three-way merge of the ticket file (records) into the app's tickets (local: id -> entry)
+    # against what the app last read or wrote (base: id -> record_fingerprint).
+    # Returns (added, updated, removed, conflicts, needs_save); needs_save means the merged
+    # result differs from the file.
+    disk = {r["id"]: r for r in records}
+
+    added, updated, removed, conflicts = [], [], [], []
+    needs_save = False
+
+    for entry_id, record in disk.items():
+        fingerprint = record_fingerprint(record)
+        current = local.get(entry_id)
+        disk_changed = base.get(entry_id) != fingerprint
+
+        if current is None:
+            if entry_id not in base:
+                added.append(record)
+            elif disk_changed:
+                conflicts.append((record, "restored: edited in the file but deleted here"))
+                added.append(record)
+            else:
+                needs_save = True  # deleted here, file still has it
+            continue
+
+        if not disk_changed:
+            if record_fingerprint(current) != fingerprint:
+                needs_save = True
+            continue
+
+        local_changed = base.get(entry_id) != record_fingerprint(current)
+        if local_changed and record_fingerprint(current) != fingerprint:
+            if resolve_conflict(current, record) is current:
+                conflicts.append((current, "kept your version"))
+                needs_save = True
+                continue
+            conflicts.append((record, "took the file's version"))
+        updated.append(record)
+
+    for entry_id, current in local.items():
+        if entry_id in disk:
+            continue
+        if entry_id not in base:
+            needs_save = True  # new here
+        elif base[entry_id] == record_fingerprint(current):
+            removed.append(current)
+        else:
+            conflicts.append((current, "kept: edited here but deleted in the file"))
+            needs_save = True
+    return added, updated, removed, conflicts, needs_save
+
+
+def merge_sync_records(by_id, tombstones, dirty_ids, sent, records):
+    # Bookkeeping half of a sync round: clears what the server acknowledged and
+    # decides which incoming records win. Returns (entries to add or update, ids to remove).
+    for record in sent:
+        current = by_id.get(record["id"]) or tombstones.get(record["id"])
+        if current is None or record_version(current) == record_version(record):
+            dirty_ids.discard(record["id"])
+            if record.get("deleted"):
+                tombstones.pop(record["id"], None)
+
+    updates, removed = [], []
+    for record in records:
+        if not valid_sync_record(record):
+            continue
+        local = by_id.get(record["id"]) or tombstones.get(record["id"])
+        if local is not None and resolve_conflict(local, record) is local:
+            continue
+
+        dirty_ids.discard(record["id"])
+        tombstones.pop(record["id"], None)
+        if record.get("deleted"):
+            if record["id"] in by_id:
+                removed.append(record["id"])
+            continue
+        updates.append(normalize_entry(record))
+    return updates, removed
+
+
+class SyncStore:
+    def __init__(self, log_path):
+        self.log_path = log_path
+        self.records = {}  # id -> record, kept in ascending "seq" order
+        self.seq = 0
+        self.lock = threading.Lock()
+        self.load_log()
+
+    def load_log(self):
+        if not os.path.exists(self.log_path):
+            return
+
+        lines = 0
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # truncated tail from a crash mid-append
+                lines += 1
+                if not valid_sync_record(record):
+                    continue  # accepted by an older server that didn't check types
+                self.records.pop(record["id"], None)
+                self.records[record["id"]] = record
+                self.seq = max(self.seq, record.get("seq", 0))
+
+        if lines > 2 * len(self.records):
+            self.compact_log()
+
+    def compact_log(self):
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in self.records.values():
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, self.log_path)
+
+    def sync(self, since, changes):
+        with self.lock:
+            accepted = []
+            for record in changes:
+                if not valid_sync_record(record):
+                    continue
+                current = self.records.get(record["id"])
+                if current is not None and resolve_conflict(current, record) is current:
+                    continue
+                self.seq += 1
+                record = dict(record, seq=self.seq)
+                self.records.pop(record["id"], None)
+                self.records[record["id"]] = record
+                accepted.append(record)
+
+            if accepted:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    for record in accepted:
+                        f.write(json.dumps(record) + "\n")
+
+            if since > self.seq:
+                since = 0  # server was reset, client needs a full pull
+
+            changed = []
+            for record in reversed(self.records.values()):
+                if record["seq"] <= since:
+                    break
+                changed.append(record)
+            changed.reverse()
+            return changed, self.seq
+
+
+class SyncRequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        if self.path != "/sync":
+            self.send_error(404)
+            return
+
+        token = self.headers.get("Authorization", "").partition("Bearer ")[2]
+        if not hmac.compare_digest(token, self.server.token):
+            self.send_error(401, "Missing or wrong team token")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length))
+            since = int(payload.get("since", 0))
+            changes = payload.get("records", [])
+            if not isinstance(changes, list):
+                raise ValueError("records must be a list")
+        except (ValueError, TypeError, AttributeError):
+            self.send_error(400, "Invalid sync payload")
+            return
+
+        changed, seq = self.server.store.sync(since, changes)
+        body = json.dumps({"seq": seq, "records": changed}).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        print(f"[Sync Server] {self.address_string()} {format % args}")
+
+
+def load_sync_token(log_path):
+    # The team token lives next to the log so it survives server restarts.
+    token_path = log_path + ".token"
+    if os.path.exists(token_path):
+        with open(token_path, "r") as f:
+            token = f.read().strip()
+        if token:
+            return token
+    token = secrets.token_hex(16)
+    with open(token_path, "w") as f:
+        f.write(token)
+    return token
+
+
+def make_sync_server(host, port, log_path, token):
+    server = ThreadingHTTPServer((host, port), SyncRequestHandler)
+    server.store = SyncStore(log_path)
+    server.token = token
+    return server
+
+
+def run_sync_server(host, port, log_path, token=None):
+    token = token or load_sync_token(log_path)
+    server = make_sync_server(host, port, log_path, token)
+    print(f"[Sync Server] Serving team log {log_path} on http://{host}:{port}/sync")
+    print(f"[Sync Server] Team token: {token} (enter it under Settings → Team Sync)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def sync_request(server_url, since, records, token=""):
+    response = requests.post(server_url.rstrip("/") + "/sync", json={"since": since, "records": records},
+                             headers={"Authorization": f"Bearer {token}"}, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def load_settings_file():
+    if os.path.exists(SETTINGS_FILE):
+        with open(SETTINGS_FILE, "r") as f:
+            return json.load(f)
+    return default_settings()
+
+
+def default_settings():
+    return {
+        "reminders_enabled": True,
+        "reminder_interval": 60,
+        "ticket_reminders_enabled": False,
+        "ticket_reminder_minutes": DEFAULT_TICKET_REMINDER_MINUTES,
+        "default_view_mode": "Full",
+        "duplicate_window_days": 30,
+        "sync_enabled": False,
+        "sync_server_url": f"http://localhost:{DEFAULT_SYNC_PORT}",
+        "sync_token": "",
+        "sync_interval": 30,
+        "ipc_port": DEFAULT_IPC_PORT,
+        "archive_after_months": 6,
+        "search_workers": 0,
+        "backup_generations": 10,
+        "backup_interval_minutes": 5
+    }
+
+
+class Snapshot:
+    # Binary copy of the normalized, sorted entries so startup can skip the JSON
+    # parse, normalization and timestamp sort. Layout (little-endian):
+    #   header | string offsets (count + 1 x u32) | records (RECORD) | UTF-8 string blob
+    # Every text field is an index into the deduplicated string table.
+    MAGIC = b"SNTT"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHxxQqII20sI")
+    STRING_FIELDS = ("id", "modified_by", "timestamp", "caller", "title", "description",
+                     "additional_notes", "assignment_group", "state", "done_at")
+    RECORD = struct.Struct(f"<{len(STRING_FIELDS)}IIB")
+
+    def __init__(self, f, mapped, record_count, pending, string_count):
+        self.file = f
+        self.mapped = mapped
+        self.record_count = record_count
+        self.pending = pending
+        self.offsets_start = self.HEADER.size
+        self.records_start = self.offsets_start + 4 * (string_count + 1)
+        self.blob_start = self.records_start + self.RECORD.size * record_count
+        self.strings = {}
+
+    @classmethod
+    def write(cls, path, entries, source_stamp):
+        # source_stamp: what write_json_atomic returned for the JSON these entries were saved to.
+        table = {}
+        strings = []
+        records = []
+        pending = 0
+        # Startup shows rows in file order, so always store them newest first
+        # whatever order the caller's list happens to be in.
+        for entry in sorted(entries, key=lambda e: parse_timestamp(e["timestamp"]), reverse=True):
+            indices = []
+            for field in cls.STRING_FIELDS:
+                value = str(entry.get(field) or "")
+                index = table.get(value)
+                if index is None:
+                    index = table[value] = len(strings)
+                    strings.append(value)
+                indices.append(index)
+            records.append(cls.RECORD.pack(*indices, entry.get("rev", 0), 1 if entry.get("done") else 0))
+            if not entry.get("done"):
+                pending += 1
+
+        encoded = [value.encode("utf-8") for value in strings]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+
+        (size, mtime_ns), sha1 = source_stamp
+        header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, size, mtime_ns, len(records), pending, sha1, len(strings))
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            f.write(b"".join(records))
+            f.write(b"".join(encoded))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path, source_path):
+        signature = file_signature(source_path)
+        if signature is None or not os.path.exists(path):
+            return None
+
+        f = open(path, "rb")
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            f.close()
+            return None
+
+        try:
+            magic, version, size, mtime_ns, record_count, pending, sha1, string_count = cls.HEADER.unpack_from(mapped, 0)
+            if magic != cls.MAGIC or version != cls.VERSION or [size, mtime_ns] != signature or sha1 != file_sha1(source_path):
+                raise ValueError("stale snapshot")
+            snapshot = cls(f, mapped, record_count, pending, string_count)
+            if snapshot.blob_start > len(mapped):
+                raise ValueError("truncated snapshot")
+            return snapshot
+        except (ValueError, struct.error):
+            mapped.close()
+            f.close()
+            return None
+
+    def __len__(self):
+        return self.record_count
+
+    def string(self, index):
+        value = self.strings.get(index)
+        if value is None:
+            start, end = struct.unpack_from("<II", self.mapped, self.offsets_start + 4 * index)
+            value = self.strings[index] = self.mapped[self.blob_start + start:self.blob_start + end].decode("utf-8")
+        return value
+
+    def record(self, i):
+        fields = self.RECORD.unpack_from(self.mapped, self.records_start + i * self.RECORD.size)
+        strings = len(self.STRING_FIELDS)
+        return fields[:strings], fields[strings], fields[strings + 1]
+
+    def row(self, i):
+        indices, _, done = self.record(i)
+        s = self.string
+        # Same column order as the main Treeview.
+        return s(indices[0]), ("☑" if done else "☐", s(indices[2]), s(indices[3]), s(indices[4]), s(indices[5]), s(indices[6]), s(indices[7]), s(indices[8]))
+
+    def entry(self, i):
+        indices, rev, done = self.record(i)
+        entry = {field: self.string(index) for field, index in zip(self.STRING_FIELDS, indices)}
+        entry["rev"] = rev
+        entry["done"] = bool(done)
+        return entry
+
+    def entries(self):
+        return [self.entry(i) for i in range(self.record_count)]
+
+    def close(self):
+        self.mapped.close()
+        self.file.close()
+
+
+def claim_instance_port(port):
+    # The bound port doubles as the single-instance lock: only one process can hold it.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    else:
+        # Lets a restart rebind while connections from the last run sit in TIME_WAIT;
+        # off Windows it still refuses a second listener on the same port.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind(("127.0.0.1", port))
+        sock.listen(5)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def publish_ipc_endpoint(sock):
+    token = secrets.token_hex(16)
+    with open(IPC_FILE, "w") as f:
+        json.dump({"port": sock.getsockname()[1], "token": token, "pid": os.getpid()}, f)
+    return token
+
+
+def ipc_request(message, timeout=2.0):
+    try:
+        with open(IPC_FILE, "r") as f:
+            info = json.load(f)
+        port, token = info["port"], info["token"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=timeout) as sock:
+            sock.sendall(json.dumps(dict(message, token=token)).encode("utf-8") + b"\n")
+            reply = sock.makefile("rb").readline()
+        return json.loads(reply)
+    except (OSError, ValueError):
+        return None
+
+
+def send_quick_add(fields):
+    # Wait longer than the app does, so a slow add is answered rather than retried.
+    # "busy" means the app dropped the request unrun (e.g. still loading), so it's safe to resend.
+    deadline = time.time() + IPC_STARTUP_WAIT
+    while True:
+        reply = ipc_request({"cmd": "quick_add", "entry": fields}, timeout=IPC_REPLY_TIMEOUT * 2)
+        if reply is None or reply.get("error") != "busy" or time.time() > deadline:
+            return reply
+        time.sleep(0.5)
+
+
+def quick_add(fields, port):
+    reply = send_quick_add(fields)
+    if reply is not None:
+        return reply.get("ok", False)
+
+    # Nobody is running. Hold the instance port while writing so an app that
+    # starts up meanwhile can't load the file halfway through our update.
+    lock = None
+    for _ in range(20):
+        lock = claim_instance_port(port)
+        if lock is not None:
+            break
+        reply = send_quick_add(fields)
+        if reply is not None:
+            return reply.get("ok", False)
+        time.sleep(0.1)
+    if lock is None:
+        return False
+
+    try:
+        entry = normalize_entry(dict(fields, timestamp=datetime.now().strftime("%m/%d/%Y %I:%M:%S %p"), done=False, rev=1, modified_by="quick-add"))
+        try:
+            entries = read_entries(DATA_FILE)
+        except ValueError:
+            print("The ticket file is damaged; open the app to recover it from a backup.")
+            return False
+        entries.insert(0, entry)
+        write_json_atomic(DATA_FILE, entries, indent=2)
+
+        if os.path.exists(SYNC_STATE_FILE):
+            with open(SYNC_STATE_FILE, "r") as f:
+                state = json.load(f)
+            state["dirty"] = sorted(set(state.get("dirty", [])) | {entry["id"]})
+            write_json_atomic(SYNC_STATE_FILE, state, indent=2)
+        return True
+    finally:
+        lock.close()
+
+
+def run_quick_add(args):
+    port = load_settings_file().get("ipc_port", DEFAULT_IPC_PORT)
+    fields = {
+        "caller": args.caller,
+        "title": args.title,
+        "description": args.description,
+        "assignment_group": args.group,
+        "state": args.state
+    }
+    if args.title:
+        ok = quick_add(fields, port)
+        print("Ticket added." if ok else "Could not add ticket.")
+        sys.exit(0 if ok else 1)
+
+    root = tk.Tk()
+    root.title("Quick Add Ticket")
+    set_window_icon(root)
+    root.attributes("-topmost", True)
+    root.resizable(False, False)
+
+    form_font = ("Arial", 10)
+    frame = ttk.Frame(root, padding=10)
+    frame.pack(fill="both", expand=True)
+
+    variables = {}
+    for row, (label, key) in enumerate([("Caller", "caller"), ("Title*", "title"), ("Description", "description"), ("Assignment Group", "assignment_group")]):
+        ttk.Label(frame, text=label, font=form_font).grid(row=row, column=0, sticky=tk.E, pady=2, padx=5)
+        variables[key] = tk.StringVar(value=fields[key])
+        widget = ttk.Entry(frame, textvariable=variables[key], width=40, font=form_font)
+        widget.grid(row=row, column=1, pady=2)
+        if key == "title":
+            widget.focus_set()
+
+    def submit(event=None):
+        values = dict(fields, **{k: v.get().strip() for k, v in variables.items()})
+        if not values["title"]:
+            messagebox.showerror("Error", "Enter a Title for Entry.", parent=root)
+            return
+        if quick_add(values, port):
+            root.destroy()
+        else:
+            messagebox.showerror("Error", "Could not add the ticket.", parent=root)
+
+    ttk.Button(frame, text="Add Ticket", command=submit).grid(row=4, column=1, sticky=tk.E, pady=(8, 0))
+    root.bind("<Return>", submit)
+    root.bind("<Escape>", lambda e: root.destroy())
+    root.mainloop()
+
+
+class Rollups:
+    VERSION = 1
+    PERIODS = ("day", "week")
+
+    def __init__(self):
+        self.counts = {}  # (period, bucket, state, group, done) -> [tickets, lag seconds, lagged tickets]
+        self.contributions = {}  # id -> (day, week, state, group, done, lag seconds or None)
+        self.dirty = False  # changed since the last save/load
+
+    @staticmethod
+    def contribution(entry):
+        created = parse_timestamp(entry["timestamp"])
+        if created == datetime.min:
+            day = week = "Unknown"
+        else:
+            year, week_no, _ = created.isocalendar()
+            day = created.strftime("%Y-%m-%d")
+            week = f"{year}-W{week_no:02d}"
+
+        done = bool(entry.get("done"))
+        lag = None
+        if done and entry.get("done_at") and created != datetime.min:
+            done_at = parse_timestamp(entry["done_at"])
+            if done_at != datetime.min:
+                lag = max(0.0, (done_at - created).total_seconds())
+
+        return (day, week, entry.get("state", ""), entry.get("assignment_group", ""), done, lag)
+
+    def apply(self, contribution, sign):
+        day, week, state, group, done, lag = contribution
+        for key in (("day", day, state, group, done), ("week", week, state, group, done)):
+            cell = self.counts.setdefault(key, [0, 0.0, 0])
+            cell[0] += sign
+            if lag is not None:
+                cell[1] += sign * lag
+                cell[2] += sign
+            if cell[0] <= 0:
+                del self.counts[key]
+
+    def update(self, entry, deleted=False):
+        self.dirty = True
+        old = self.contributions.pop(entry["id"], None)
+        if old is not None:
+            self.apply(old, -1)
+        if not deleted:
+            new = self.contribution(entry)
+            self.contributions[entry["id"]] = new
+            self.apply(new, 1)
+
+    def rebuild(self, entries):
+        self.counts = {}
+        self.contributions = {}
+        for entry in entries:
+            self.update(entry)
+        self.dirty = True
+
+    def rows(self, period):
+        grouped = {}
+        for (p, bucket, state, group, done), (tickets, lag_total, lagged) in self.counts.items():
+            if p != period:
+                continue
+            row = grouped.setdefault((bucket, group, state), [0, 0, 0.0, 0])
+            row[0] += tickets
+            if done:
+                row[1] += tickets
+                row[2] += lag_total
+                row[3] += lagged
+
+        rows = []
+        for (bucket, group, state), (tickets, submitted, lag_total, lagged) in grouped.items():
+            avg_lag_hours = round(lag_total / lagged / 3600, 2) if lagged else None
+            rows.append((bucket, group, state, tickets, submitted, avg_lag_hours))
+        rows.sort(key=lambda r: (r[0], r[1].lower(), r[2]), reverse=True)
+        return rows
+
+    def save(self, path, source_signature):
+        write_json_atomic(path, {
+            "version": self.VERSION,
+            "source": source_signature,
+            "counts": [list(key) + cell for key, cell in self.counts.items()],
+            "contributions": {k: list(v) for k, v in self.contributions.items()}
+        })
+        self.dirty = False
+
+    def load(self, path, source_signature):
+        if source_signature is None or not os.path.exists(path):
+            return False
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION or data.get("source") != source_signature:
+                return False
+            self.counts = {tuple(row[:5]): row[5:] for row in data["counts"]}
+            self.contributions = {k: tuple(v) for k, v in data["contributions"].items()}
+            self.dirty = False
+            return True
+        except (ValueError, KeyError, TypeError):
+            return False
+
+
+def write_report_csv(path, rows, period):
+    with open(path, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([period.capitalize(), "Assignment Group", "State", "Tickets", "Submitted", "Avg Submission Lag (h)"])
+        for bucket, group, state, tickets, submitted, avg_lag in rows:
+            writer.writerow([bucket, group, state, tickets, submitted, "" if avg_lag is None else avg_lag])
+
+
+def export_report(output, period):
+    rollups = Rollups()
+    if not rollups.load(ROLLUP_FILE, file_signature(DATA_FILE)):
+        try:
+            rollups.rebuild(read_entries(DATA_FILE) + read_archive_entries())
+        except ValueError as e:
+            sys.exit(f"Could not read {DATA_FILE}: {e}")
+    rows = rollups.rows(period)
+    write_report_csv(output, rows, period)
+    print(f"Wrote {len(rows)} {period} rows to {output}")
+
+
+class PrefixIndex:
+    # Sorted keys for narrow prefixes plus a ranked top list for every "wide" prefix
+    # (more than SCAN_LIMIT keys below it), i.e. a trie that only keeps the nodes
+    # where a bisect-and-sort would be slow. Wide nodes are built bottom-up so each
+    # key is scanned once, and updates patch the lists on the key's own path. Every
+    # key missing from a node's list ranks after the list's last entry; when
+    # decrements shrink a list below TOP_K it is rebuilt on its next lookup.
+    SCAN_LIMIT = 256
+    TOP_K = 8
+    CAPACITY = 16
+
+    def __init__(self):
+        self.keys = []  # sorted, lowercased
+        self.counts = {}
+        self.spellings = {}  # key -> {spelling as typed: count}
+        self.tops = {}  # wide prefix -> keys ranked best first
+        self.stale = set()
+        self.values = {}  # entry id -> value it contributes
+
+    def rank(self, key):
+        return (-self.counts[key], key)
+
+    def key_range(self, prefix, lo=0, hi=None):
+        lo = bisect.bisect_left(self.keys, prefix, lo, len(self.keys) if hi is None else hi)
+        return lo, bisect.bisect_left(self.keys, prefix + "\uffff", lo, len(self.keys) if hi is None else hi)
+
+    def build(self, items):
+        # items: (entry id, value) pairs.
+        self.counts = {}
+        self.spellings = {}
+        self.values = {}
+        for entry_id, value in items:
+            value = (value or "").strip()
+            if value:
+                self.values[entry_id] = value
+        for value, count in Counter(self.values.values()).items():
+            key = value.lower()
+            self.counts[key] = self.counts.get(key, 0) + count
+            self.spellings.setdefault(key, {})[value] = count
+        self.keys = sorted(self.counts)
+        self.tops = {}
+        self.stale = set()
+        if len(self.keys) > self.SCAN_LIMIT:
+            self.build_node("", 0, len(self.keys))
+
+    def build_node(self, prefix, lo, hi):
+        depth = len(prefix)
+        candidates = []
+        i = lo
+        if self.keys[i] == prefix:
+            candidates.append(self.keys[i])
+            i += 1
+        while i < hi:
+            child = prefix + self.keys[i][depth]
+            _, end = self.key_range(child, i, hi)
+            if end - i > self.SCAN_LIMIT:
+                candidates.extend(self.build_node(child, i, end))
+            else:
+                candidates.extend(self.keys[i:end])
+            i = end
+        top = heapq.nsmallest(self.CAPACITY, candidates, key=self.rank)
+        self.tops[prefix] = top
+        return top
+
+    def rebuild_node(self, prefix):
+        lo, hi = self.key_range(prefix)
+        self.tops[prefix] = heapq.nsmallest(self.CAPACITY, self.keys[lo:hi], key=self.rank)
+        self.stale.discard(prefix)
+
+    def update(self, entry_id, value):
+        value = (value or "").strip()
+        old = self.values.get(entry_id)
+        if old == value or (old is None and not value):
+            return
+        if old is not None:
+            self.remove(old)
+            del self.values[entry_id]
+        if value:
+            self.add(value)
+            self.values[entry_id] = value
+
+    def add(self, value):
+        key = value.lower()
+        if key not in self.counts:
+            bisect.insort(self.keys, key)
+            self.counts[key] = 0
+            self.spellings[key] = {}
+        self.counts[key] += 1
+        self.spellings[key][value] = self.spellings[key].get(value, 0) + 1
+
+        for i in range(len(key) + 1):
+            prefix = key[:i]
+            top = self.tops.get(prefix)
+            if top is None:
+                lo, hi = self.key_range(prefix)
+                if hi - lo > self.SCAN_LIMIT:
+                    self.rebuild_node(prefix)  # prefix just became wide
+                continue
+            if key in top:
+                top.sort(key=self.rank)
+            elif not top or self.rank(key) < self.rank(top[-1]):
+                top.append(key)
+                top.sort(key=self.rank)
+                del top[self.CAPACITY:]
+
+    def remove(self, value):
+        key = value.lower()
+        if key not in self.counts:
+            return
+        self.counts[key] -= 1
+        spellings = self.spellings[key]
+        spellings[value] -= 1
+        if spellings[value] <= 0:
+            del spellings[value]
+
+        gone = self.counts[key] <= 0
+        for i in range(len(key) + 1):
+            top = self.tops.get(key[:i])
+            if top is None or key not in top:
+                continue
+            top.remove(key)
+            # It may only stay if it still beats the last listed key; otherwise an
+            # unlisted key could now outrank it.
+            if not gone and top and self.rank(key) < self.rank(top[-1]):
+                top.append(key)
+                top.sort(key=self.rank)
+            if len(top) < self.TOP_K:
+                self.stale.add(key[:i])
+
+        if gone:
+            del self.keys[bisect.bisect_left(self.keys, key)]
+            del self.counts[key]
+            del self.spellings[key]
+
+    def display(self, key):
+        spellings = self.spellings[key]
+        return max(spellings, key=spellings.get)
+
+    def suggest(self, prefix, limit=8):
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+
+        if prefix in self.tops:
+            if prefix in self.stale:
+                self.rebuild_node(prefix)
+            ranked = self.tops[prefix]
+        else:
+            lo, hi = self.key_range(prefix)
+            ranked = sorted(self.keys[lo:hi], key=self.rank)
+
+        return [self.display(key) for key in ranked[:limit]]
+
+
+class DuplicateIndex:
+    # One-permutation MinHash over word and word-pair shingles (each shingle is
+    # hashed once and binned), banded for LSH. Two rows per band finds ~97% of
+    # pairs at the 0.6 threshold; candidates are then checked with an exact
+    # Jaccard so the threshold is what actually decides. Recurring descriptions make
+    # some buckets huge, so each shared band counts 1/bucket size and candidates are
+    # checked best score first: a rare shared band says more than a crowded one.
+    NUM_HASHES = 16
+    ROWS_PER_BAND = 2
+    THRESHOLD = 0.6
+    MAX_CANDIDATES = 200  # exact Jaccard checks per query
+    MAX_BUCKET_SCAN = 500  # newest members read from each bucket
+    MIN_TOKENS = 3
+    SIGNATURE_CACHE_SIZE = 10000
+
+    def __init__(self, window_days=30):
+        self.window = window_days * 86400
+        self.buckets = {}  # (band, band values) -> {id: None}, oldest first
+        self.items = {}  # id -> (created, shingles, band keys, timestamp, title)
+        self.signatures = {}  # text -> (shingles, band keys); the same descriptions recur constantly
+
+    @staticmethod
+    def shingles(text):
+        tokens = re.findall(r"[a-z0-9]+", text.lower())
+        if len(tokens) < DuplicateIndex.MIN_TOKENS:
+            return set()
+        return set(tokens) | set(" ".join(pair) for pair in zip(tokens, tokens[1:]))
+
+    def band_keys(self, shingles):
+        empty = 1 << 64
+        signature = [empty] * self.NUM_HASHES
+        for sh in shingles:
+            h = hash(sh) & 0xFFFFFFFFFFFFFFFF
+            b = h % self.NUM_HASHES
+            if h < signature[b]:
+                signature[b] = h
+
+        # Densify: an empty bin borrows the next filled bin's value, offset by the
+        # distance, so short texts don't all collide on their empty bins.
+        for b in range(self.NUM_HASHES):
+            if signature[b] == empty:
+                for step in range(1, self.NUM_HASHES):
+                    value = signature[(b + step) % self.NUM_HASHES]
+                    if value < empty:
+                        signature[b] = value + step * empty
+                        break
+
+        rows = self.ROWS_PER_BAND
+        return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(self.NUM_HASHES // rows)]
+
+    def signature(self, text):
+        cached = self.signatures.get(text)
+        if cached is None:
+            shingles = self.shingles(text)
+            cached = (shingles, self.band_keys(shingles) if shingles else [])
+            if len(self.signatures) >= self.SIGNATURE_CACHE_SIZE:
+                self.signatures.clear()
+            self.signatures[text] = cached
+        return cached
+
+    @staticmethod
+    def entry_text(entry):
+        return f"{entry['title']} {entry['description']}"
+
+    def add(self, entry, created=None):
+        if created is None:
+            created = parse_timestamp(entry["timestamp"])
+            if created == datetime.min:
+                return
+            created = created.timestamp()
+        if created < time.time() - self.window:
+            return
+
+        shingles, keys = self.signature(self.entry_text(entry))
+        if not shingles:
+            return
+
+        for key in keys:
+            self.buckets.setdefault(key, {})[entry["id"]] = None
+        self.items[entry["id"]] = (created, shingles, keys, entry["timestamp"], entry["title"])
+
+    def remove(self, entry_id):
+        item = self.items.pop(entry_id, None)
+        if item is None:
+            return
+        for key in item[2]:
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                bucket.pop(entry_id, None)
+                if not bucket:
+                    del self.buckets[key]
+
+    def update(self, entry, deleted=False):
+        self.remove(entry["id"])
+        if not deleted:
+            self.add(entry)
+
+    def query(self, text, limit=3):
+        shingles, keys = self.signature(text)
+        if not shingles:
+            return []
+
+        scores = {}
+        for key in keys:
+            bucket = self.buckets.get(key)
+            if bucket:
+                weight = 1 / len(bucket)
+                for entry_id in itertools.islice(reversed(bucket), self.MAX_BUCKET_SCAN):
+                    scores[entry_id] = scores.get(entry_id, 0) + weight
+
+        cutoff = time.time() - self.window
+        matches = []
+        for entry_id in heapq.nlargest(self.MAX_CANDIDATES, scores, key=scores.get):
+            created, other, _, timestamp, title = self.items[entry_id]
+            if created >= cutoff:
+                similarity = len(shingles & other) / len(shingles | other)
+                if similarity >= self.THRESHOLD:
+                    matches.append((similarity, entry_id, timestamp, title))
+
+        matches.sort(reverse=True)
+        return matches[:limit]
+
+
+class AutocompleteEntry(ttk.Entry):
+    IGNORED_KEYS = {"Up", "Down", "Return", "Escape", "Tab", "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R"}
+
+    def __init__(self, master, index, **kwargs):
+        super().__init__(master, **kwargs)
+        self.index = index
+        self.popup = None
+        self.listbox = None
+        self.last_text = ""
+
+        self.bind("<KeyRelease>", self.on_key_release)
+        self.bind("<Down>", self.on_down)
+        self.bind("<Up>", self.on_up)
+        self.bind("<Return>", self.on_accept)
+        self.bind("<Tab>", self.on_accept)
+        self.bind("<Escape>", lambda e: self.hide_suggestions())
+        self.bind("<FocusOut>", lambda e: self.after(150, self.hide_if_unfocused))
+
+    def on_key_release(self, event):
+        if event.keysym in self.IGNORED_KEYS:
+            return
+        text = self.get()
+        if text == self.last_text:
+            return
+        self.last_text = text
+
+        suggestions = [s for s in self.index.suggest(text) if s != text]
+        if suggestions:
+            self.show_suggestions(suggestions)
+        else:
+            self.hide_suggestions()
+
+    def show_suggestions(self, suggestions):
+        if self.popup is None:
+            self.popup = tk.Toplevel(self)
+            self.popup.overrideredirect(True)
+            self.popup.attributes("-topmost", True)
+            self.listbox = tk.Listbox(self.popup, font=self.cget("font") or ("Arial", 10), activestyle="none", exportselection=False)
+            self.listbox.pack(fill=tk.BOTH, expand=True)
+            self.listbox.bind("<ButtonRelease-1>", self.on_accept)
+
+        self.listbox.delete(0, tk.END)
+        for suggestion in suggestions:
+            self.listbox.insert(tk.END, suggestion)
+        self.listbox.config(height=len(suggestions))
+        self.popup.geometry(f"{self.winfo_width()}x{self.listbox.winfo_reqheight()}+{self.winfo_rootx()}+{self.winfo_rooty() + self.winfo_height()}")
+        self.popup.deiconify()
+
+    def hide_suggestions(self):
+        if self.popup is not None:
+            self.popup.destroy()
+            self.popup = None
+            self.listbox = None
+
+    def hide_if_unfocused(self):
+        focused = self.focus_get()
+        if focused is not self and focused is not self.listbox:
+            self.hide_suggestions()
+
+    def move_selection(self, step):
+        if self.listbox is None:
+            return None
+        current = self.listbox.curselection()
+        index = current[0] + step if current else (0 if step > 0 else self.listbox.size() - 1)
+        index = max(0, min(self.listbox.size() - 1, index))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+        return "break"
+
+    def on_down(self, event):
+        return self.move_selection(1)
+
+    def on_up(self, event):
+        return self.move_selection(-1)
+
+    def on_accept(self, event):
+        if self.listbox is None:
+            return None
+        current = self.listbox.curselection()
+        if not current:
+            if event.widget is self and event.keysym == "Tab":
+                self.hide_suggestions()
+            return None
+
+        value = self.listbox.get(current[0])
+        self.delete(0, tk.END)
+        self.insert(0, value)
+        self.icursor(tk.END)
+        self.last_text = value
+        self.hide_suggestions()
+        self.focus_set()
+        return "break"
+
+
+class EditDialog:
+    # One Toplevel for the whole selection. Widgets are built once and refilled for
+    # the record being shown; edits are held per id until Save applies them together.
+    FIELDS = [
+        ("Caller", "caller"),
+        ("Title", "title"),
+        ("Description", "description"),
+        ("Additional Notes", "additional_notes"),
+        ("Assignment Group", "assignment_group"),
+        ("State", "state")
+    ]
+    TEXT_FIELDS = ("description", "additional_notes")
+
+    def __init__(self, app):
+        self.app = app
+        self.ids = []
+        self.index = 0
+        self.lookup = {}
+        self.pending = {}
+
+        self.win = tk.Toplevel(app.root)
+        set_window_icon(self.win)
+        self.win.title("Edit Entry")
+        self.win.geometry("500x370")
+        self.win.protocol("WM_DELETE_WINDOW", self.cancel)
+        self.win.bind("<Escape>", lambda e: self.cancel())
+        self.win.bind("<Alt-Left>", lambda e: self.step(-1))
+        self.win.bind("<Alt-Right>", lambda e: self.step(1))
+
+        form_font = ("Arial", 10)
+        self.fields = {}
+
+        nav_frame = ttk.Frame(self.win)
+        nav_frame.grid(row=0, column=0, columnspan=2, pady=(5, 0))
+        self.prev_btn = ttk.Button(nav_frame, text="◀ Prev", command=lambda: self.step(-1))
+        self.prev_btn.pack(side=tk.LEFT, padx=5)
+        self.position_var = tk.StringVar()
+        ttk.Label(nav_frame, textvariable=self.position_var, width=14, anchor="center").pack(side=tk.LEFT)
+        self.next_btn = ttk.Button(nav_frame, text="Next ▶", command=lambda: self.step(1))
+        self.next_btn.pack(side=tk.LEFT, padx=5)
+
+        row = 1
+        for label, key in self.FIELDS:
+            ttk.Label(self.win, text=label, font=form_font).grid(row=row, column=0, sticky="e", padx=5, pady=2)
+
+            if key in self.TEXT_FIELDS:
+                text_wrapper = ttk.Frame(self.win)
+                text_wrapper.grid(row=row, column=1, padx=5, pady=2, sticky="ew")
+
+                text_widget = tk.Text(
+                    text_wrapper,
+                    height=4,
+                    width=50,
+                    font=form_font,
+                    wrap="word",
+                    bd=0,
+                    relief="flat",
+                    background="white",
+                    foreground="black"
+                )
+                text_widget.pack(side="top", fill="x")
+
+                underline = tk.Frame(text_wrapper, height=2, bg="grey")
+                underline.pack(fill="x")
+
+                def on_focus_in(event, u=underline): u.config(bg="#1a73e8")
+                def on_focus_out(event, u=underline): u.config(bg="grey")
+
+                text_widget.bind("<FocusIn>", on_focus_in)
+                text_widget.bind("<FocusOut>", on_focus_out)
+
+                self.fields[key] = text_widget
+
+            elif key == "state":
+                state_var = tk.StringVar()
+                combo = ttk.Combobox(self.win, textvariable=state_var, values=STATES, state="readonly",
+                                     font=form_font, width=48)
+                combo.grid(row=row, column=1, padx=5, pady=2, sticky="ew")
+                self.fields[key] = state_var
+
+            else:
+                var = tk.StringVar()
+                entry_widget = ttk.Entry(self.win, textvariable=var, width=50, font=form_font)
+                entry_widget.grid(row=row, column=1, padx=5, pady=2, sticky="ew")
+                self.fields[key] = var
+
+            row += 1
+
+        self.done_var = tk.BooleanVar()
+        ttk.Checkbutton(self.win, text="Done", variable=self.done_var).grid(row=row, column=1, sticky="w", padx=5, pady=(10, 5))
+        row += 1
+
+        button_frame = ttk.Frame(self.win)
+        button_frame.grid(row=row, column=0, columnspan=2, pady=15)
+        ttk.Button(button_frame, text="Save", command=self.save).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Delete", command=self.delete_current).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT, padx=5)
+
+    def exists(self):
+        return bool(self.win.winfo_exists())
+
+    def open(self, ids):
+        # One pass over the entries builds the id lookup; rows without a ticket
+        # (e.g. archive search results) are left out.
+        self.lookup = {e["id"]: e for e in self.app.entries}
+        self.ids = [entry_id for entry_id in ids if entry_id in self.lookup]
+        self.pending = {}
+        if not self.ids:
+            return self.close()
+        self.show(0)
+        self.win.deiconify()
+        self.win.lift()
+        self.win.grab_set()
+
+    def values(self):
+        values = {}
+        for key, field in self.fields.items():
+            if key in self.TEXT_FIELDS:
+                values[key] = field.get("1.0", tk.END).strip()
+            else:
+                values[key] = field.get()
+        values["done"] = self.done_var.get()
+        return values
+
+    def stash(self):
+        # Keep the shown record's edits only if they differ from the ticket.
+        entry_id = self.ids[self.index]
+        entry = self.lookup[entry_id]
+        values = self.values()
+        if any(values[key] != entry.get(key, "") for _, key in self.FIELDS) or values["done"] != entry.get("done", False):
+            self.pending[entry_id] = values
+        else:
+            self.pending.pop(entry_id, None)
+
+    def show(self, index):
+        self.index = index
+        entry_id = self.ids[index]
+        values = self.pending.get(entry_id) or self.lookup[entry_id]
+        for key, field in self.fields.items():
+            if key in self.TEXT_FIELDS:
+                field.delete("1.0", tk.END)
+                field.insert(tk.END, values.get(key, ""))
+            else:
+                field.set(values.get(key, ""))
+        self.done_var.set(values.get("done", False))
+
+        self.position_var.set(f"{index + 1} of {len(self.ids)}")
+        self.prev_btn.state(["!disabled"] if index > 0 else ["disabled"])
+        self.next_btn.state(["!disabled"] if index < len(self.ids) - 1 else ["disabled"])
+
+    def step(self, delta):
+        index = self.index + delta
+        if 0 <= index < len(self.ids):
+            self.stash()
+            self.show(index)
+        return "break"
+
+    def close(self):
+        self.pending = {}
+        self.ids = []
+        self.win.grab_release()
+        self.win.withdraw()
+
+    def cancel(self):
+        if not self.ids:
+            return self.close()
+        self.stash()
+        if self.pending and not messagebox.askyesno("Discard Changes", f"Discard changes to {len(self.pending)} ticket(s)?", parent=self.win):
+            return
+        self.close()
+
+    def save(self):
+        if self.ids:
+            self.stash()
+        app = self.app
+        # Rebuilt so tickets removed meanwhile (merge, sync) are skipped rather than resurrected.
+        live = {e["id"]: e for e in app.entries}
+        changed = []
+        for entry_id, values in self.pending.items():
+            entry = live.get(entry_id)
+            if entry is None:
+                continue
+            for _, key in self.FIELDS:
+                entry[key] = values[key]
+            app.set_done(entry, values["done"])
+            app.mark_changed(entry)
+            changed.append(entry)
+        self.close()
+
+        if not changed:
+            return
+        app.save_entries()
+        app.refresh_changed_rows([], changed, [])
+
+        def show_confirmation():
+            app.status_var.set(f"✔ {len(changed)} Ticket(s) Updated Successfully.")
+            app.status_label.config(background="#d4edda", foreground="#155724")
+
+            def reset_status():
+                app.status_label.config(background="", foreground="black")
+                app.update_status_bar()
+
+            app.root.after(3000, reset_status)
+
+        app.root.after(100, show_confirmation)
+
+    def delete_current(self):
+        if not messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this entry?", parent=self.win):
+            return
+        app = self.app
+        entry_id = self.ids.pop(self.index)
+        self.pending.pop(entry_id, None)
+        entry = self.lookup.pop(entry_id)
+        if entry in app.entries:
+            app.entries.remove(entry)
+            app.mark_changed(entry, deleted=True)
+            app.undo_stack.append(("delete", [entry]))
+            app.save_entries()
+            app.refresh_changed_rows([], [], [entry])
+
+            def show_delete_confirmation():
+                app.status_var.set("✖ Ticket(s) Deleted Successfully.")
+                app.status_label.config(background="#f8d7da", foreground="#721c24")
+
+                def reset_status():
+                    app.status_label.config(background="", foreground="black")
+                    app.update_status_bar()
+
+                app.root.after(3000, reset_status)
+
+            app.root.after(100, show_delete_confirmation)
+
+        if not self.ids:
+            if self.pending:
+                self.save()
+            else:
+                self.close()
+            return
+        self.show(min(self.index, len(self.ids) - 1))
+
+
+class ReminderScheduler:
+    # Tk's after() can't take arbitrarily long delays, so far-off timers re-arm in steps.
+    MAX_WAIT_MS = 60 * 60 * 1000
+
+    def __init__(self, root, on_due):
+        self.root = root
+        self.on_due = on_due
+        self.heap = []
+        self.due_times = {}  # key -> due time; heap items that disagree are stale
+        self.after_id = None
+        self.armed_for = None
+        self.holding = False
+
+    def hold(self):
+        # Batch many schedule() calls: the timer is armed once, by release().
+        self.holding = True
+
+    def release(self):
+        self.holding = False
+        self.arm()
+
+    def schedule(self, key, due):
+        self.due_times[key] = due
+        heapq.heappush(self.heap, (due, key))
+        if len(self.heap) > 2 * len(self.due_times) + 64:
+            self.heap = [(d, k) for k, d in self.due_times.items()]
+            heapq.heapify(self.heap)
+        if not self.holding and (self.armed_for is None or due < self.armed_for):
+            self.arm()
+
+    def cancel(self, key):
+        self.due_times.pop(key, None)
+
+    def clear(self):
+        self.heap = []
+        self.due_times = {}
+        self.arm()
+
+    def arm(self):
+        if self.holding:
+            return
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+            self.armed_for = None
+
+        while self.heap and self.due_times.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        if not self.heap:
+            return
+
+        due = self.heap[0][0]
+        delay = max(0, int((due - time.time()) * 1000))
+        self.armed_for = due
+        self.after_id = self.root.after(min(delay, self.MAX_WAIT_MS), self.fire)
+
+    def fire(self):
+        self.after_id = None
+        self.armed_for = None
+
+        now = time.time()
+        due_keys = []
+        while self.heap and self.heap[0][0] <= now:
+            due, key = heapq.heappop(self.heap)
+            if self.due_times.get(key) == due:
+                del self.due_times[key]
+                due_keys.append(key)
+
+        if due_keys:
+            try:
+                self.on_due(due_keys)
+            except Exception as e:
+                print(f"[Reminders] Error: {e}")
+        self.arm()
+
+
 class TicketTrackerApp:
-    def __init__(self, root):
+    WATCH_MIN_DELAY = 1000
+    WATCH_MAX_DELAY = 30000
+
+    def __init__(self, root, instance_socket=None, ipc_token=None):
         self.root = root
-        root.iconbitmap(resource_path("sntt.ico"))
+        set_window_icon(root)
         self.root.title(f"{APP_NAME} v{APP_VERSION}")
         self.root.geometry("1000x500")
 
@@ -77,8 +1770,33 @@ class TicketTrackerApp:
         self.sort_reverse = False
         self.settings = self.load_settings()
         self.is_compact_view = False
+        self.loaded = False
+        # Answer other launches right away; their requests wait in ipc_calls until loading is done.
+        self.ipc_calls = queue.Queue()
+        if instance_socket is not None:
+            self.start_ipc_server(instance_socket, ipc_token)
+        self.load_sync_state()
         self.load_entries()
 
+        # Indexes start empty and are filled by finish_loading() once the table is on screen.
+        self.rollups = Rollups()
+        self.suggestions = {field: PrefixIndex() for field in AUTOCOMPLETE_FIELDS}
+        self.duplicates = DuplicateIndex(self.settings.get("duplicate_window_days", 30))
+        self.reminders = ReminderScheduler(self.root, self.on_reminders_due)
+        self.pending = {}  # id -> entry, for every ticket not yet submitted
+        self.month_members = {}
+        self.backup_dirty_months = set()
+        self.backup_store = None  # created on the backup worker thread
+        self.backup_queue = queue.Queue()
+        self.last_backup = 0
+        self.executor = None
+        self.search_generation = 0
+        self.search_futures = []
+        self.search_results = queue.Queue()
+        self.drain_job = None
+        self.archived_ids = None  # read from ARCHIVED_IDS_FILE on first sync pull
+        self.edit_dialog = None
+
         self.create_widgets()
         if self.settings.get("default_view_mode", "Full") == "Compact":
             self.toggle_quick_entry_mode(force=True)
@@ -88,37 +1806,76 @@ class TicketTrackerApp:
         self.root.bind("<Shift-Down>", self.extend_selection_down)
         self.undo_stack = []
         self.root.bind("<Control-z>", self.undo_last_action)
-        self.start_reminder_thread()
         self.start_autosave_thread()
+        self.root.after(2000, self.run_sync)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after_idle(self.finish_loading)
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            # First real use of the data after a snapshot start: materialize it.
+            self._entries = self.snapshot.entries()
+            self.snapshot.close()
+            self.snapshot = None
+        return self._entries
+
+    @entries.setter
+    def entries(self, value):
+        self._entries = value
+
+    def finish_loading(self):
+        snapshot_valid = self._entries is None
+        self.remember_disk_state(self.loaded_signature)
+        self.load_rollups()
+        self.load_suggestions()
+        self.load_duplicate_index()
+        self.load_backups()
+        self.start_reminders()
+        self.loaded = True
+        self.update_status_bar()
+        self.poll_ipc_calls()
+
+        if not snapshot_valid and os.path.exists(DATA_FILE):
+            # Persist ids/normalization so the snapshot matches the JSON.
+            if self.save_entries():
+                self.write_snapshot()
+
+        self.watch_delay = self.WATCH_MIN_DELAY
+        self.watch_busy = False
+        self.root.after(self.watch_delay, self.poll_data_file)
+
+    def write_snapshot(self):
+        # Only right after a successful save_entries(): it is stamped with what that save wrote.
+        try:
+            Snapshot.write(SNAPSHOT_FILE, self.entries, self.saved_stamp)
+        except OSError as e:
+            print(f"[Snapshot] Could not write startup snapshot: {e}")
 
     def load_settings(self):
-        if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, "r") as f:
-                return json.load(f)
-        return {
-            "reminders_enabled": True,
-            "reminder_interval": 60,
-            "default_view_mode": "Full"
-        }
+        return load_settings_file()
 
     def save_settings(self, settings):
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=2)
+        write_json_atomic(SETTINGS_FILE, settings, indent=2)
 
     def open_settings(self):
         settings = self.settings
 
         win = tk.Toplevel(self.root)
-        win.iconbitmap(resource_path("sntt.ico"))
+        set_window_icon(win)
         win.title("Settings")
-        win.geometry("300x360")
+        win.geometry("320x650")
         win.grab_set()
 
         reminders_enabled = tk.BooleanVar(value=settings.get("reminders_enabled", True))
+        ticket_reminders_enabled = tk.BooleanVar(value=settings.get("ticket_reminders_enabled", False))
         reminder_amount = tk.IntVar()
         reminder_unit = tk.StringVar()
         view_mode_var = tk.StringVar(value=settings.get("default_view_mode", "Full").capitalize())
+        sync_enabled = tk.BooleanVar(value=settings.get("sync_enabled", False))
+        sync_server_url = tk.StringVar(value=settings.get("sync_server_url", f"http://localhost:{DEFAULT_SYNC_PORT}"))
+        sync_token = tk.StringVar(value=settings.get("sync_token", ""))
+        archive_months = tk.IntVar(value=settings.get("archive_after_months", 6))
 
         total_minutes = settings.get("reminder_interval", 60)
         if total_minutes % 60 == 0:
@@ -138,6 +1895,7 @@ class TicketTrackerApp:
         interval_frame.pack(anchor="w", pady=(0, 5))
         ttk.Entry(interval_frame, textvariable=reminder_amount, width=5).pack(side="left")
         ttk.Combobox(interval_frame, textvariable=reminder_unit, values=["Minutes", "Hours"], width=10, state="readonly").pack(side="left", padx=5)
+        ttk.Checkbutton(reminder_frame, text="Nag About Overdue Tickets", variable=ticket_reminders_enabled).pack(anchor="w")
 
         view_mode_frame = ttk.LabelFrame(win, text="Startup View", padding=10)
         view_mode_frame.pack(fill="x", padx=10, pady=(0, 10))
@@ -145,6 +1903,25 @@ class TicketTrackerApp:
         ttk.Label(view_mode_frame, text="Default View Mode:").pack(anchor="w", pady=(0, 5))
         ttk.Combobox(view_mode_frame, textvariable=view_mode_var, values=["Full", "Compact"], state="readonly").pack(anchor="w")
 
+        sync_frame = ttk.LabelFrame(win, text="Team Sync", padding=10)
+        sync_frame.pack(fill="x", padx=10, pady=(0, 10))
+
+        ttk.Checkbutton(sync_frame, text="Share Log With Team", variable=sync_enabled).pack(anchor="w", pady=(0, 5))
+        ttk.Label(sync_frame, text="Sync Server:").pack(anchor="w")
+        ttk.Entry(sync_frame, textvariable=sync_server_url, width=35).pack(anchor="w")
+        ttk.Label(sync_frame, text="Team Token:").pack(anchor="w")
+        ttk.Entry(sync_frame, textvariable=sync_token, width=35, show="•").pack(anchor="w")
+
+        archive_frame = ttk.LabelFrame(win, text="Archive", padding=10)
+        archive_frame.pack(fill="x", padx=10, pady=(0, 10))
+
+        months_frame = ttk.Frame(archive_frame)
+        months_frame.pack(anchor="w", pady=(0, 5))
+        ttk.Label(months_frame, text="Archive submitted tickets older than").pack(side="left")
+        ttk.Entry(months_frame, textvariable=archive_months, width=4).pack(side="left", padx=5)
+        ttk.Label(months_frame, text="months").pack(side="left")
+        ttk.Button(archive_frame, text="Archive Now", command=lambda: self.archive_old_entries(max(1, archive_months.get()))).pack(anchor="w")
+
         update_frame = ttk.LabelFrame(win, text="Updates", padding=5)
         update_frame.pack(fill="x", padx=10, pady=(0, 10))
 
@@ -163,55 +1940,109 @@ class TicketTrackerApp:
 
             settings["reminders_enabled"] = reminders_enabled.get()
             settings["reminder_interval"] = min(1440, total)
+            settings["ticket_reminders_enabled"] = ticket_reminders_enabled.get()
             settings["default_view_mode"] = view_mode_var.get()
+            settings["sync_enabled"] = sync_enabled.get()
+            settings["sync_server_url"] = sync_server_url.get().strip()
+            settings["sync_token"] = sync_token.get().strip()
+            settings["archive_after_months"] = max(1, archive_months.get())
 
             self.save_settings(settings)
             self.settings = settings  # update the instance variable
+            self.start_reminders()
             win.destroy()
 
+            if settings["sync_enabled"]:
+                self.root.after(0, self.run_sync)
+
         ttk.Button(button_frame, text="Save", command=on_save).pack(pady=5, fill="x")
 
-    def start_reminder_thread(self):
-        print("[DEBUG] Inside start_reminder_thread()")
+    def start_reminders(self):
+        self.reminders.hold()
+        try:
+            self.reminders.clear()
+            self.pending.clear()
 
-        def remind_loop_safe():
-            try:
-                print("[Reminder Thread] Thread started.")
-                while True:
-                    try:
-                        interval = self.settings.get("reminder_interval", 60)
-                        print(f"[Reminder Thread] Sleeping for {interval} minutes...")
-                        time.sleep(max(1, interval) * 60)
-                        if self.settings.get("reminders_enabled", True):
-                            print("[Reminder Thread] Triggering alert")
-                            self.root.after(0, self.show_reminder)
-                    except Exception as inner:
-                        print(f"[Reminder Thread] Inner error: {inner}")
-            except Exception as e:
-                print(f"[Reminder Thread] Failed to start: {e}")
+            interval = max(1, self.settings.get("reminder_interval", 60))
+            self.reminders.schedule("interval", time.time() + interval * 60)
+            for entry in self.entries:
+                self.track_entry(entry)
+        finally:
+            self.reminders.release()
+
+    def track_entry(self, entry, deleted=False):
+        entry_id = entry["id"]
+        if deleted or entry.get("done"):
+            self.pending.pop(entry_id, None)
+            self.last_nagged.pop(entry_id, None)
+            self.reminders.cancel(entry_id)
+            return
 
-        try:
-            print("[Reminder Thread] Launching thread...")
-            thread = threading.Thread(target=remind_loop_safe, daemon=True)
-            thread.start()
-            print("[Reminder Thread] Successfully launched.")
-        except Exception as e:
-            print(f"[Reminder Thread] Fatal error: {e}")
+        self.pending[entry_id] = entry
+        thresholds = self.settings.get("ticket_reminder_minutes", DEFAULT_TICKET_REMINDER_MINUTES)
+        minutes = thresholds.get(entry.get("state"))
+        if not self.settings.get("ticket_reminders_enabled", False) or not minutes:
+            self.reminders.cancel(entry_id)
+            return
+
+        created = parse_timestamp(entry["timestamp"])
+        created = created.timestamp() if created != datetime.min else time.time()
+        last = self.last_nagged.get(entry_id, created)
+        self.reminders.schedule(entry_id, max(created, last) + minutes * 60)
+
+    def on_reminders_due(self, keys):
+        if "interval" in keys:
+            interval = max(1, self.settings.get("reminder_interval", 60))
+            self.reminders.schedule("interval", time.time() + interval * 60)
+            if self.settings.get("reminders_enabled", True):
+                self.show_reminder()
+
+        overdue_ids = set(k for k in keys if k != "interval")
+        if not overdue_ids:
+            return
+
+        now = time.time()
+        overdue = [self.pending[k] for k in overdue_ids if k in self.pending]
+        overdue.sort(key=lambda e: parse_timestamp(e["timestamp"]), reverse=True)
+        for entry in overdue:
+            self.last_nagged[entry["id"]] = now
+            self.track_entry(entry)
+        if overdue:
+            self.save_sync_state()  # so a restart doesn't nag about these again right away
+            self.show_overdue_reminder(overdue)
 
     def show_reminder(self):
-        pending = len([e for e in self.entries if not e.get("done")])
+        pending = len(self.pending)
         if pending > 0:
-            winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS)
+            play_system_sound("SystemAsterisk")
             popup = tk.Toplevel(self.root)
             popup.title("Reminder")
             popup.geometry("250x100")
-            popup.iconbitmap(resource_path("sntt.ico"))
+            set_window_icon(popup)
             popup.update_idletasks()
             popup.attributes("-topmost", True)
             popup.lift()
             popup.focus_force()
             ttk.Label(popup, text=f"You have {pending} pending tickets to submit.", wraplength=300, justify="center").pack(pady=20)
             ttk.Button(popup, text="OK", command=popup.destroy).pack(pady=5)
+
+    def show_overdue_reminder(self, overdue):
+        play_system_sound("SystemExclamation")
+        popup = tk.Toplevel(self.root)
+        popup.title("Overdue Tickets")
+        popup.geometry("320x200")
+        set_window_icon(popup)
+        popup.update_idletasks()
+        popup.attributes("-topmost", True)
+        popup.lift()
+        popup.focus_force()
+
+        lines = [f"• [{e['state']}] {e['title']}" for e in overdue[:5]]
+        if len(overdue) > 5:
+            lines.append(f"...and {len(overdue) - 5} more")
+        ttk.Label(popup, text="Still not submitted:", font=("Arial", 10, "bold")).pack(pady=(10, 5))
+        ttk.Label(popup, text="\n".join(lines), wraplength=300, justify="left").pack(padx=10)
+        ttk.Button(popup, text="OK", command=popup.destroy).pack(pady=10)
     
     def create_widgets(self):
         self.create_form_section()
@@ -249,15 +2080,16 @@ class TicketTrackerApp:
         self.assignment_group_var = tk.StringVar()
         self.state_var = tk.StringVar()
         self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self.on_search_text_changed)
 
         ttk.Label(left_form, text="Caller", font=form_font).grid(row=0, column=0, sticky=tk.E, pady=2, padx=5)
-        ttk.Entry(left_form, textvariable=self.caller_var, width=30, font=form_font).grid(row=0, column=1, pady=2)
+        AutocompleteEntry(left_form, self.suggestions["caller"], textvariable=self.caller_var, width=30, font=form_font).grid(row=0, column=1, pady=2)
 
         ttk.Label(left_form, text="Title*", font=form_font).grid(row=1, column=0, sticky=tk.E, pady=2, padx=5)
-        ttk.Entry(left_form, textvariable=self.title_var, width=30, font=form_font).grid(row=1, column=1, pady=2)
+        AutocompleteEntry(left_form, self.suggestions["title"], textvariable=self.title_var, width=30, font=form_font).grid(row=1, column=1, pady=2)
 
         ttk.Label(left_form, text="Assignment Group", font=form_font).grid(row=2, column=0, sticky=tk.E, pady=2, padx=5)
-        ttk.Entry(left_form, textvariable=self.assignment_group_var, width=30, font=form_font).grid(row=2, column=1, pady=2)
+        AutocompleteEntry(left_form, self.suggestions["assignment_group"], textvariable=self.assignment_group_var, width=30, font=form_font).grid(row=2, column=1, pady=2)
 
         ttk.Label(left_form, text="State", font=form_font).grid(row=3, column=0, sticky=tk.E, pady=2, padx=5)
         self.state_menu = ttk.Combobox(left_form, textvariable=self.state_var, values=STATES, state="readonly", width=28, font=form_font)
@@ -294,6 +2126,8 @@ class TicketTrackerApp:
 
         self.description_text.bind("<FocusIn>", on_desc_focus_in)
         self.description_text.bind("<FocusOut>", on_desc_focus_out)
+        self.description_text.bind("<KeyRelease>", lambda e: self.schedule_duplicate_check())
+        self.title_var.trace_add("write", lambda *args: self.schedule_duplicate_check())
 
 
         ttk.Label(right_form, text="Additional Notes", font=form_font).grid(row=1, column=0, sticky=tk.W, pady=2, padx=5)
@@ -338,6 +2172,10 @@ class TicketTrackerApp:
 
         button_form.columnconfigure(1, weight=1)
 
+        self.duplicate_var = tk.StringVar()
+        self.duplicate_check_id = None
+        self.duplicate_label = ttk.Label(form_frame, textvariable=self.duplicate_var, foreground="#b35c00", font=form_font)
+
     def create_search_section(self):
         search_frame = ttk.Frame(self.root)
         search_frame.pack(pady=10)
@@ -347,6 +2185,7 @@ class TicketTrackerApp:
 
         search_entry = ttk.Entry(combined_search_frame, textvariable=self.search_var, width=50)
         search_entry.pack(side=tk.LEFT)
+        self.search_entry = search_entry
 
         search_entry.bind("<Return>", lambda event: self.search_entries())
 
@@ -359,11 +2198,15 @@ class TicketTrackerApp:
         clear_btn.pack(side=tk.LEFT, padx=(2, 2))
 
         ttk.Button(combined_search_frame, text="Search", command=self.search_entries).pack(side=tk.LEFT, padx=(0, 5))
+
+        self.search_archive_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(combined_search_frame, text="Archive", variable=self.search_archive_var).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(search_frame, text="Export", command=self.export_to_csv).pack(side=tk.LEFT, padx=5)
         ttk.Button(search_frame, text="Edit", command=self.edit_entry_window).pack(side=tk.LEFT, padx=5)
         ttk.Button(search_frame, text="Copy", command=self.copy_entry).pack(side=tk.LEFT, padx=5)
         ttk.Button(search_frame, text="Delete", command=self.confirm_delete).pack(side=tk.LEFT, padx=5)
         ttk.Button(search_frame, text="Undo", command=self.undo_last_action).pack(side=tk.LEFT, padx=5)
+        ttk.Button(search_frame, text="Reports", command=self.open_reports).pack(side=tk.LEFT, padx=5)
         ttk.Button(search_frame, text="Settings", command=self.open_settings).pack(side=tk.LEFT, padx=5)
 
      
@@ -408,9 +2251,13 @@ class TicketTrackerApp:
                 self.tree.column(col, width=140)
 
         self.tree.bind("<Double-1>", self.edit_entry_window)
+        self.tree.bind("<Return>", self.edit_entry_window)
         self.tree.bind("<Button-1>", self.toggle_done)
 
-        self.populate_tree(self.entries)
+        if self.snapshot is not None:
+            self.populate_tree_from_snapshot()
+        else:
+            self.populate_tree(self.entries)
 
 
     def create_status_bar(self):
@@ -432,10 +2279,13 @@ class TicketTrackerApp:
 
 
     def update_status_bar(self):
-        total = len(self.entries)
+        if self.loaded:
+            total = len(self.entries)
+            not_done = len(self.pending)
+        else:
+            total, not_done = self.startup_counts
         selected = len(self.tree.selection())
-        done = len([e for e in self.entries if e.get("done")])
-        not_done = total - done
+        done = total - not_done
         timestamp = self.last_saved if hasattr(self, "last_saved") else "Not saved yet"
 
         self.status_var.set(
@@ -476,32 +2326,20 @@ class TicketTrackerApp:
             self.delete_entries()
 
     def load_entries(self):
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, "r") as f:
-                try:
-                    raw_entries = json.load(f)
-                    self.entries = []
-                    for e in raw_entries:
-                        timestamp = e.get("timestamp", "")
-                        try:
-                            dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                            timestamp = dt.strftime("%m/%d/%Y %I:%M:%S %p")
-                        except:
-                            pass
-                        self.entries.append({
-                            "timestamp": timestamp,
-                            "caller": e.get("caller", ""),
-                            "title": e.get("title", ""),
-                            "description": e.get("description", ""),
-                            "additional_notes": e.get("additional_notes", ""),
-                            "assignment_group": e.get("assignment_group", ""),
-                            "state": e.get("state", "New"),
-                            "done": e.get("done", False)
-                        })
-                except json.JSONDecodeError:
-                    self.entries = []
+        # Taken first: if the file changes while we read it, the watcher sees a new signature and merges.
+        self.loaded_signature = file_signature(DATA_FILE)
+        self.snapshot = Snapshot.open(SNAPSHOT_FILE, DATA_FILE)
+        if self.snapshot is not None:
+            self.entries = None
+            self.startup_counts = (len(self.snapshot), self.snapshot.pending)
+            return
+
+        try:
+            self.entries = read_entries(DATA_FILE)
+        except ValueError as e:
+            self.entries = self.recover_data_file(e)
+        self.startup_counts = (len(self.entries), len([e for e in self.entries if not e.get("done")]))
 
-                
         def parse_time(entry):
             try:
                 return datetime.strptime(entry["timestamp"], "%m/%d/%Y %I:%M:%S %p")
@@ -511,11 +2349,437 @@ class TicketTrackerApp:
         self.entries.sort(key=parse_time, reverse=True)
 
 
+    def recover_data_file(self, error):
+        # Never start from an empty list over a damaged file: set it aside and
+        # fall back to the newest backup generation whose chunks all verify.
+        corrupt_path = f"{DATA_FILE}.corrupt-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        os.replace(DATA_FILE, corrupt_path)
+        print(f"[Backup] {DATA_FILE} is unreadable ({error}); moved to {corrupt_path}")
+
+        entries, created, archive = None, None, {}
+        if os.path.isdir(BACKUP_DIR):
+            entries, created, archive = BackupStore(BACKUP_DIR).restore_newest_valid()
+
+        if entries is None:
+            messagebox.showerror("Ticket File Damaged", f"Your ticket file could not be read and no valid backup was found.\n\nThe damaged file was kept as:\n{corrupt_path}")
+            return []
+
+        write_json_atomic(DATA_FILE, entries, indent=2)
+        for month, records in archive.items():
+            # Only put back archive months that are missing or damaged too.
+            path = os.path.join(ARCHIVE_DIR, f"{month}.json")
+            try:
+                read_partition(path)
+            except (OSError, ValueError):
+                os.makedirs(ARCHIVE_DIR, exist_ok=True)
+                write_partition(path, records)
+        messagebox.showwarning("Ticket File Restored", f"Your ticket file could not be read, so the backup from {created} was restored ({len(entries)} tickets).\n\nThe damaged file was kept as:\n{corrupt_path}")
+        return entries
+
     def save_entries(self):
-        with open(DATA_FILE, "w") as f:
-            json.dump(self.entries, f, indent=2)
+        if self.loaded and file_signature(DATA_FILE) != self.disk_signature:
+            # Someone else wrote the file since we last did; fold their changes in first.
+            try:
+                self.merge_external_changes(read_entries(DATA_FILE))
+            except ValueError as e:
+                print(f"[File Watch] Ignoring unreadable external change: {e}")
+
+        try:
+            self.saved_stamp = write_json_atomic(DATA_FILE, self.entries, indent=2)
+        except OSError as e:
+            messagebox.showerror("Save Error", f"Your tickets could not be saved:\n{e}\n\nThe previous copy on disk is unchanged.")
+            return False
+        self.remember_disk_state(self.saved_stamp[0])
         self.last_saved = datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")
+        self.save_sync_state()
+        if self.loaded:
+            self.queue_backup()
         self.update_status_bar()
+        return True
+
+    def save_rollups(self):
+        # Rewriting every contribution is O(tickets), so this runs on autosave and close rather
+        # than on every change. Call it right after a successful save_entries(): the file it
+        # is stamped with must be the one the rollups match. After a crash they're rebuilt.
+        if not self.rollups.dirty:
+            return
+        try:
+            self.rollups.save(ROLLUP_FILE, self.disk_signature)
+        except OSError as e:
+            print(f"[Reports] Could not save rollups: {e}")
+
+    def autosave(self):
+        if self.save_entries():
+            self.save_rollups()
+
+    def load_backups(self):
+        self.month_members = {}
+        for entry in self.entries:
+            self.month_members.setdefault(backup_month(entry), {})[entry["id"]] = entry
+
+        def backup_worker():
+            # The store is created and used only on this thread.
+            try:
+                self.backup_store = BackupStore(BACKUP_DIR, self.settings.get("backup_generations", 10))
+            except OSError as e:
+                print(f"[Backup] Backups disabled: {e}")
+                return
+
+            # Launch check, off the Tk thread: only re-read appdata.json if it isn't the
+            # file the newest generation was taken from.
+            signature = file_signature(DATA_FILE)
+            if signature is not None and signature != self.backup_store.source:
+                try:
+                    name = self.backup_store.write_all(read_entries(DATA_FILE), signature)
+                    if name:
+                        print(f"[Backup] Wrote generation {os.path.basename(name)} (launch check)")
+                except (OSError, ValueError) as e:
+                    print(f"[Backup] Launch check failed: {e}")
+
+            # Archive partitions written before they were backed up (partitions archived
+            # from now on are queued by archive_old_entries).
+            missing = {}
+            for path in archive_partitions():
+                key = ARCHIVE_BACKUP_PREFIX + os.path.basename(path)[:-len(".json")]
+                if key not in self.backup_store.current:
+                    try:
+                        missing[key] = read_partition(path)
+                    except (OSError, ValueError) as e:
+                        print(f"[Backup] Can't back up {os.path.basename(path)}: {e}")
+            if missing:
+                self.backup_queue.put((missing, None))
+
+            while True:
+                changed_months, source = self.backup_queue.get()
+                try:
+                    name = self.backup_store.write_generation(changed_months, source)
+                    if name:
+                        print(f"[Backup] Wrote generation {os.path.basename(name)} ({len(changed_months)} changed months)")
+                except (OSError, ValueError) as e:
+                    print(f"[Backup] Failed: {e}")
+                finally:
+                    self.backup_queue.task_done()
+
+        threading.Thread(target=backup_worker, daemon=True).start()
+
+    def queue_backup(self, force=False):
+        interval = self.settings.get("backup_interval_minutes", 5) * 60
+        if not self.backup_dirty_months or (not force and time.time() - self.last_backup < interval):
+            return
+
+        # Copy only the changed months on the Tk thread; serializing and hashing happen on the worker.
+        changed_months = {}
+        for month in self.backup_dirty_months:
+            changed_months[month] = [dict(e) for e in self.month_members.get(month, {}).values()]
+        self.backup_dirty_months = set()
+        self.last_backup = time.time()
+        # Called right after a save, so the months now match the file on disk.
+        self.backup_queue.put((changed_months, self.disk_signature))
+
+    def remember_disk_state(self, signature):
+        # signature: of the file self.entries were read from or saved to, not a fresh stat that
+        # could already belong to someone else's write.
+        self.disk_signature = signature
+        self.disk_base = {e["id"]: record_fingerprint(e) for e in self.entries}
+
+    def poll_data_file(self):
+        signature = file_signature(DATA_FILE)
+        if signature is None or signature == self.disk_signature or self.watch_busy:
+            self.watch_delay = min(self.WATCH_MAX_DELAY, self.watch_delay * 2)
+            self.root.after(self.watch_delay, self.poll_data_file)
+            return
+
+        self.watch_busy = True
+        self.watch_delay = self.WATCH_MIN_DELAY
+
+        def read_worker():
+            try:
+                records = read_entries(DATA_FILE)
+            except (OSError, ValueError) as e:
+                print(f"[File Watch] Could not read {DATA_FILE}: {e}")
+                records = None
+            self.root.after(0, lambda: finish(records))
+
+        def finish(records):
+            self.watch_busy = False
+            if records is not None and file_signature(DATA_FILE) == signature and signature != self.disk_signature:
+                needs_save = self.merge_external_changes(records)
+                self.disk_signature = signature
+                if needs_save:
+                    self.save_entries()
+            self.root.after(self.watch_delay, self.poll_data_file)
+
+        threading.Thread(target=read_worker, daemon=True).start()
+
+    def merge_external_changes(self, records):
+        # Returns True when the merged result differs from the file and needs saving.
+        local = {e["id"]: e for e in self.entries}
+        added, updated, removed, conflicts, needs_save = merge_file_records(local, records, self.disk_base)
+
+        if not (added or updated or removed):
+            if conflicts:
+                self.show_merge_conflicts(conflicts)
+            return needs_save
+
+        # Changes from the file go through mark_changed like any edit made here, so they get a
+        # new rev, reach the team log and clear a stale tombstone.
+        file_fingerprints = {r["id"]: record_fingerprint(r) for r in added + updated}
+        for record in updated:
+            local[record["id"]].update(record)
+            self.mark_changed(local[record["id"]])
+        for record in added:
+            if record["id"] in self.disk_base:
+                # Deleted here but edited in the file: outrank our own delete.
+                tombstone = self.tombstones.get(record["id"])
+                deleted_rev = tombstone["rev"] if tombstone else self.disk_base[record["id"]][0] + 1
+                record["rev"] = max(record.get("rev", 0), deleted_rev)
+            self.entries.append(record)
+            self.mark_changed(record)
+        if removed:
+            removed_ids = set(e["id"] for e in removed)
+            self.entries = [e for e in self.entries if e["id"] not in removed_ids]
+            for entry in removed:
+                self.mark_changed(entry, deleted=True)
+
+        self.entries.sort(key=lambda e: parse_timestamp(e["timestamp"]), reverse=True)
+        self.disk_base.update(file_fingerprints)
+        for entry in removed:
+            self.disk_base.pop(entry["id"], None)
+        self.refresh_changed_rows(added, updated, removed)
+
+        self.status_var.set(f"↻ Merged {len(added) + len(updated) + len(removed)} Change(s) Made Outside the App.")
+        self.status_label.config(background="#fff3cd", foreground="#856404")
+
+        def reset_status():
+            self.status_label.config(background="", foreground="black")
+            self.update_status_bar()
+
+        self.root.after(3000, reset_status)
+
+        if conflicts:
+            self.show_merge_conflicts(conflicts)
+        return True  # the new revs differ from the file
+
+    def refresh_changed_rows(self, added, updated, removed):
+        if self.search_var.get().strip():
+            self.search_entries()
+            return
+
+        for entry in removed:
+            if self.tree.exists(entry["id"]):
+                self.tree.delete(entry["id"])
+        for record in updated:
+            if self.tree.exists(record["id"]):
+                self.tree.item(record["id"], values=entry_row_values(record))
+
+        if not added:
+            if removed:
+                self.restripe_rows()
+            return
+
+        # New rows go where the default newest-first order puts them; other sort orders just append.
+        newest_first = self.sort_column in (None, "Timestamp") and (self.sort_column is None or self.sort_reverse)
+        for record in added:
+            if self.tree.exists(record["id"]):
+                continue
+            index = tk.END
+            if newest_first:
+                children = self.tree.get_children()
+                created = parse_timestamp(record["timestamp"])
+                lo, hi = 0, len(children)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if parse_timestamp(self.tree.set(children[mid], "Timestamp")) > created:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                index = lo
+            self.tree.insert("", index, iid=record["id"], values=entry_row_values(record))
+        self.restripe_rows()
+
+    def restripe_rows(self):
+        for i, item in enumerate(self.tree.get_children()):
+            self.tree.item(item, tags=("evenrow" if i % 2 == 0 else "oddrow",))
+
+    def show_merge_conflicts(self, conflicts):
+        lines = [f"• {record['title']} ({record['timestamp']}): {outcome}" for record, outcome in conflicts[:5]]
+        if len(conflicts) > 5:
+            lines.append(f"...and {len(conflicts) - 5} more")
+        print(f"[File Watch] {len(conflicts)} conflicting change(s) merged.")
+        messagebox.showwarning("Conflicting Changes", "The ticket file was changed outside the app while you were editing:\n\n" + "\n".join(lines))
+
+    def load_rollups(self):
+        if not self.rollups.load(ROLLUP_FILE, file_signature(DATA_FILE)):
+            print("[Reports] Rollups missing or stale, rebuilding.")
+            # Archived tickets still count in reports.
+            self.rollups.rebuild(self.entries + read_archive_entries())
+
+    def load_suggestions(self):
+        for field in AUTOCOMPLETE_FIELDS:
+            self.suggestions[field].build((e["id"], e[field]) for e in self.entries)
+
+    def load_duplicate_index(self):
+        self.duplicates = DuplicateIndex(self.settings.get("duplicate_window_days", 30))
+        cutoff = time.time() - self.duplicates.window
+        recent = []
+        for entry in self.entries:  # newest first
+            created = parse_timestamp(entry["timestamp"])
+            if created == datetime.min:
+                continue
+            if created.timestamp() < cutoff:
+                break
+            recent.append((entry, created.timestamp()))
+        for entry, created in reversed(recent):
+            self.duplicates.add(entry, created)
+
+    def index_entry(self, entry, deleted=False):
+        self.index_live(entry, deleted=deleted)
+        self.rollups.update(entry, deleted=deleted)
+
+    def index_live(self, entry, deleted=False):
+        # Indexes that only cover tickets in appdata.json; archiving drops tickets from these alone.
+        month = backup_month(entry)
+        if deleted:
+            self.month_members.get(month, {}).pop(entry["id"], None)
+        else:
+            self.month_members.setdefault(month, {})[entry["id"]] = entry
+        self.backup_dirty_months.add(month)
+        self.track_entry(entry, deleted=deleted)
+        self.duplicates.update(entry, deleted=deleted)
+        for field in AUTOCOMPLETE_FIELDS:
+            self.suggestions[field].update(entry["id"], None if deleted else entry[field])
+
+    def set_done(self, entry, done):
+        if done and not entry.get("done"):
+            entry["done_at"] = datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")
+        elif not done:
+            entry["done_at"] = ""
+        entry["done"] = done
+
+    def load_sync_state(self):
+        state = {}
+        if os.path.exists(SYNC_STATE_FILE):
+            with open(SYNC_STATE_FILE, "r") as f:
+                try:
+                    state = json.load(f)
+                except json.JSONDecodeError:
+                    pass
+
+        self.client_id = state.get("client_id") or uuid.uuid4().hex
+        self.last_sync_seq = state.get("last_seq", 0)
+        self.dirty_ids = set(state.get("dirty", []))
+        self.tombstones = state.get("tombstones", {})
+        self.last_nagged = state.get("last_nagged", {})  # id -> time of the last overdue reminder
+        self.sync_in_progress = False
+
+    def save_sync_state(self):
+        write_json_atomic(SYNC_STATE_FILE, {
+            "client_id": self.client_id,
+            "last_seq": self.last_sync_seq,
+            "dirty": sorted(self.dirty_ids),
+            "tombstones": self.tombstones,
+            "last_nagged": self.last_nagged
+        }, indent=2)
+
+    def mark_changed(self, entry, deleted=False):
+        entry["rev"] = entry.get("rev", 0) + 1
+        entry["modified_by"] = self.client_id
+        self.index_entry(entry, deleted=deleted)
+
+        # Tracked even while sync is off, so edits and deletes made meanwhile are pushed once it's on.
+        self.dirty_ids.add(entry["id"])
+        if deleted:
+            self.tombstones[entry["id"]] = {"id": entry["id"], "rev": entry["rev"], "modified_by": self.client_id, "deleted": True}
+        else:
+            self.tombstones.pop(entry["id"], None)
+
+    def find_entry(self, entry_id):
+        for entry in self.entries:
+            if entry["id"] == entry_id:
+                return entry
+        return None
+
+    def run_sync(self):
+        interval = max(5, self.settings.get("sync_interval", 30))
+        if not self.settings.get("sync_enabled", False) or self.sync_in_progress:
+            self.root.after(interval * 1000, self.run_sync)
+            return
+
+        # Snapshot on the Tk thread; the worker only ever sees copies.
+        outgoing = collect_outgoing(self.entries, self.tombstones, self.dirty_ids, full=self.last_sync_seq == 0)
+
+        server_url = self.settings.get("sync_server_url", f"http://localhost:{DEFAULT_SYNC_PORT}")
+        token = self.settings.get("sync_token", "")
+        since = self.last_sync_seq
+        self.sync_in_progress = True
+
+        def sync_worker():
+            try:
+                result = sync_request(server_url, since, outgoing, token)
+                self.root.after(0, lambda: self.apply_sync_result(outgoing, result))
+            except Exception as e:
+                print(f"[Sync] Failed to reach {server_url}: {e}")
+                self.root.after(0, self.finish_sync)
+
+        threading.Thread(target=sync_worker, daemon=True).start()
+
+    def finish_sync(self):
+        self.sync_in_progress = False
+        interval = max(5, self.settings.get("sync_interval", 30))
+        self.root.after(interval * 1000, self.run_sync)
+
+    def apply_sync_result(self, sent, result):
+        try:
+            self.merge_sync_result(sent, result)
+        finally:
+            self.finish_sync()
+
+    def merge_sync_result(self, sent, result):
+        by_id = {e["id"]: e for e in self.entries}
+        records = result.get("records", [])
+        if not isinstance(records, list):
+            records = []
+        if records:
+            if self.archived_ids is None:
+                self.archived_ids = read_archived_ids()
+            records = [r for r in records if not (isinstance(r, dict) and r.get("id") in self.archived_ids)]
+        updates, removed = merge_sync_records(by_id, self.tombstones, self.dirty_ids, sent, records)
+
+        for entry_id in removed:
+            self.index_entry(by_id[entry_id], deleted=True)
+        for entry in updates:
+            if entry["id"] in by_id:
+                by_id[entry["id"]].update(entry)
+            else:
+                self.entries.append(entry)
+                by_id[entry["id"]] = entry
+            self.index_entry(by_id[entry["id"]])
+        changed = len(updates) + len(removed)
+
+        self.last_sync_seq = result.get("seq", self.last_sync_seq)
+
+        if removed:
+            removed = set(removed)
+            self.entries = [e for e in self.entries if e["id"] not in removed]
+
+        if changed:
+            self.entries.sort(key=lambda e: parse_timestamp(e["timestamp"]), reverse=True)
+            self.save_entries()
+            if self.search_var.get().strip():
+                self.search_entries()
+            else:
+                self.populate_tree(self.entries, sort=False)
+
+            self.status_var.set(f"⇅ Team Log Synced ({changed} change{'s' if changed != 1 else ''}).")
+            self.status_label.config(background="#d1ecf1", foreground="#0c5460")
+
+            def reset_status():
+                self.status_label.config(background="", foreground="black")
+                self.update_status_bar()
+
+            self.root.after(3000, reset_status)
+        else:
+            self.save_sync_state()
 
 
 
@@ -526,7 +2790,32 @@ class TicketTrackerApp:
         self.additional_notes_text.delete("1.0", tk.END)
         self.assignment_group_var.set("")
         self.state_var.set("New")
+        self.show_duplicate_warning([])
+
+    def schedule_duplicate_check(self):
+        if self.duplicate_check_id is not None:
+            self.root.after_cancel(self.duplicate_check_id)
+        self.duplicate_check_id = self.root.after(250, self.check_duplicates)
+
+    def check_duplicates(self):
+        self.duplicate_check_id = None
+        text = f"{self.title_var.get()} {self.description_text.get('1.0', tk.END)}"
+        matches = self.duplicates.query(text)
+        self.show_duplicate_warning(matches)
+        return matches
+
+    def show_duplicate_warning(self, matches):
+        if not matches:
+            self.duplicate_var.set("")
+            self.duplicate_label.pack_forget()
+            return
 
+        similarity, _, timestamp, title = matches[0]
+        message = f"⚠ Possible duplicate of \"{title}\" logged {timestamp} ({similarity:.0%} similar)"
+        if len(matches) > 1:
+            message += f" and {len(matches) - 1} more"
+        self.duplicate_var.set(message)
+        self.duplicate_label.pack(anchor="w", padx=10, pady=(2, 0))
 
     def add_entry(self):
         entry = {
@@ -537,24 +2826,24 @@ class TicketTrackerApp:
             "additional_notes": self.additional_notes_text.get("1.0", tk.END).strip(),
             "assignment_group": self.assignment_group_var.get(),
             "state": self.state_var.get(),
-            "done": False
+            "done": False,
+            "done_at": "",
+            "id": uuid.uuid4().hex,
+            "rev": 0,
+            "modified_by": self.client_id
         }
 
         if not entry["title"]:
             messagebox.showerror("Error", "Enter a Title for Entry.")
             return
 
-        self.entries.append(entry)
-
-        # Explicitly sort entries by timestamp descending (newest first)
-        self.entries.sort(key=lambda e: datetime.strptime(e["timestamp"], "%m/%d/%Y %I:%M:%S %p"), reverse=True)
+        matches = self.check_duplicates()
+        if matches:
+            _, _, timestamp, title = matches[0]
+            if not messagebox.askyesno("Possible Duplicate", f"This looks like \"{title}\" logged {timestamp}.\n\nAdd it anyway?"):
+                return
 
-        self.sort_column = "Timestamp"
-        self.sort_reverse = True
-
-        self.save_entries()
-        self.populate_tree(self.entries, sort=False)
-        self.update_status_bar()
+        self.commit_new_entry(entry)
         self.clear_form()
 
         # Select and scroll to the top row
@@ -579,6 +2868,20 @@ class TicketTrackerApp:
 
 
 
+    def commit_new_entry(self, entry):
+        self.mark_changed(entry)
+        self.entries.append(entry)
+
+        # Explicitly sort entries by timestamp descending (newest first)
+        self.entries.sort(key=lambda e: datetime.strptime(e["timestamp"], "%m/%d/%Y %I:%M:%S %p"), reverse=True)
+
+        self.sort_column = "Timestamp"
+        self.sort_reverse = True
+
+        self.save_entries()
+        self.populate_tree(self.entries, sort=False)
+        self.update_status_bar()
+
     def populate_tree(self, entries, sort=True):
         self.tree.delete(*self.tree.get_children())
 
@@ -587,16 +2890,7 @@ class TicketTrackerApp:
 
         for i, entry in enumerate(entries):
             tag = "evenrow" if i % 2 == 0 else "oddrow"
-            self.tree.insert("", tk.END, values=(
-                "☑" if entry.get("done") else "☐",
-                entry["timestamp"],
-                entry["caller"],
-                entry["title"],
-                entry["description"],
-                entry["additional_notes"],
-                entry["assignment_group"],
-                entry["state"]
-            ), tags=(tag,))
+            self.tree.insert("", tk.END, iid=entry["id"], values=entry_row_values(entry), tags=(tag,))
 
         self.tree.tag_configure("evenrow", background="#dcdcdc")  
         self.tree.tag_configure("oddrow", background="white")
@@ -606,6 +2900,15 @@ class TicketTrackerApp:
 
             
 
+    def populate_tree_from_snapshot(self):
+        # Rows come straight out of the mapped file; no entry dicts are built here.
+        for i in range(len(self.snapshot)):
+            iid, values = self.snapshot.row(i)
+            self.tree.insert("", tk.END, iid=iid, values=values, tags=("evenrow" if i % 2 == 0 else "oddrow",))
+
+        self.tree.tag_configure("evenrow", background="#dcdcdc")
+        self.tree.tag_configure("oddrow", background="white")
+
     def sort_by_column(self, col):
         self.sort_reverse = (self.sort_column == col and not self.sort_reverse)
         self.sort_column = col
@@ -634,127 +2937,9 @@ class TicketTrackerApp:
         if not selected_items:
             return
 
-        for item in selected_items:
-            values = self.tree.item(item, "values")
-            selected_timestamp = values[1]  
-
-            for entry in self.entries:
-                if entry["timestamp"] == selected_timestamp:
-                    edit_win = tk.Toplevel(self.root)
-                    edit_win.iconbitmap(resource_path("sntt.ico"))
-                    edit_win.title("Edit Entry")
-                    edit_win.geometry("500x330")
-                    edit_win.grab_set()  
-
-                    form_font = ("Arial", 10)
-                    edit_fields = {}
-
-                    fields = [
-                        ("Caller", "caller"),
-                        ("Title", "title"),
-                        ("Description", "description"),
-                        ("Additional Notes", "additional_notes"),
-                        ("Assignment Group", "assignment_group"),
-                        ("State", "state")
-                    ]
-
-                    row = 0
-                    for label, key in fields:
-                        ttk.Label(edit_win, text=label, font=form_font).grid(row=row, column=0, sticky="e", padx=5, pady=2)
-
-                        if key in ["description", "additional_notes"]:
-                            text_wrapper = ttk.Frame(edit_win)
-                            text_wrapper.grid(row=row, column=1, padx=5, pady=2, sticky="ew")
-
-                            text_widget = tk.Text(
-                                text_wrapper,
-                                height=4,
-                                width=50,
-                                font=form_font,
-                                wrap="word",
-                                bd=0,
-                                relief="flat",
-                                background="white",
-                                foreground="black"
-                            )
-                            text_widget.insert(tk.END, entry[key])
-                            text_widget.pack(side="top", fill="x")
-
-                            underline = tk.Frame(text_wrapper, height=2, bg="grey")
-                            underline.pack(fill="x")
-
-                            def on_focus_in(event, u=underline): u.config(bg="#1a73e8")
-                            def on_focus_out(event, u=underline): u.config(bg="grey")
-
-                            text_widget.bind("<FocusIn>", on_focus_in)
-                            text_widget.bind("<FocusOut>", on_focus_out)
-
-                            edit_fields[key] = text_widget
-
-                        elif key == "state":
-                            state_var = tk.StringVar(value=entry[key])
-                            combo = ttk.Combobox(edit_win, textvariable=state_var, values=STATES, state="readonly",
-                                                font=form_font, width=48)
-                            combo.grid(row=row, column=1, padx=5, pady=2, sticky="ew")
-                            edit_fields[key] = state_var
-
-                        else:
-                            var = tk.StringVar(value=entry[key])
-                            entry_widget = ttk.Entry(edit_win, textvariable=var, width=50, font=form_font)
-                            entry_widget.grid(row=row, column=1, padx=5, pady=2, sticky="ew")
-                            edit_fields[key] = var
-
-                        row += 1
-
-                  
-                    done_var = tk.BooleanVar(value=entry.get("done", False))
-                    done_check = ttk.Checkbutton(edit_win, text="Done", variable=done_var)
-                    done_check.grid(row=row, column=1, sticky="w", padx=5, pady=(10, 5))
-                    row += 1
-
-                    
-                    button_frame = ttk.Frame(edit_win)
-                    button_frame.grid(row=row, column=0, columnspan=2, pady=15)
-
-                    def save_changes():
-                        for key in edit_fields:
-                            if key in ["description", "additional_notes"]:
-                                entry[key] = edit_fields[key].get("1.0", tk.END).strip()
-                            else:
-                                entry[key] = edit_fields[key].get()
-                        entry["done"] = done_var.get()
-                        self.save_entries()
-                        self.populate_tree(self.entries)
-                        edit_win.destroy()
-
-                    def delete_entry():
-                        if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this entry?"):
-                            self.entries.remove(entry)
-                            self.undo_stack.append(("delete", [entry]))  
-                            self.save_entries()
-                            self.populate_tree(self.entries)
-                            edit_win.destroy()
-
-                           
-                            def show_delete_confirmation():
-                                self.status_var.set("✖ Ticket(s) Deleted Successfully.")
-                                self.status_label.config(background="#f8d7da", foreground="#721c24")  
-
-                                def reset_status():
-                                    self.status_label.config(background="", foreground="black")
-                                    self.update_status_bar()
-
-                                self.root.after(3000, reset_status)
-
-                            self.root.after(100, show_delete_confirmation)
-
-
-                    ttk.Button(button_frame, text="Save", command=save_changes).pack(side=tk.LEFT, padx=5)
-                    ttk.Button(button_frame, text="Delete", command=delete_entry).pack(side=tk.LEFT, padx=5)
-                    ttk.Button(button_frame, text="Cancel", command=edit_win.destroy).pack(side=tk.LEFT, padx=5)
-
-                    break
-
+        if self.edit_dialog is None or not self.edit_dialog.exists():
+            self.edit_dialog = EditDialog(self)
+        self.edit_dialog.open(selected_items)
 
     def toggle_quick_entry_mode(self, force=None):
         to_compact = not self.is_compact_view if force is None else force
@@ -793,16 +2978,12 @@ class TicketTrackerApp:
         if not selected_items:
             return
 
-        deleted = []
-        for item in selected_items:
-            values = self.tree.item(item, "values")
-            timestamp = values[1]
-            for e in self.entries:
-                if e["timestamp"] == timestamp:
-                    deleted.append(e)
-                    break
+        selected_ids = set(selected_items)
+        deleted = [e for e in self.entries if e["id"] in selected_ids]
+        for e in deleted:
+            self.mark_changed(e, deleted=True)
 
-        self.entries = [e for e in self.entries if e not in deleted]
+        self.entries = [e for e in self.entries if e["id"] not in selected_ids]
         self.undo_stack.append(("delete", deleted))
         self.save_entries()
         self.populate_tree(self.entries)
@@ -830,8 +3011,10 @@ class TicketTrackerApp:
 
         action, data = self.undo_stack.pop()
         if action == "delete":
+            for e in data:
+                self.mark_changed(e)
             self.entries.extend(data)
-            self.entries.sort(key=lambda x: x["timestamp"])
+            self.entries.sort(key=lambda e: parse_timestamp(e["timestamp"]), reverse=True)
             self.save_entries()
             self.populate_tree(self.entries)
 
@@ -864,40 +3047,159 @@ class TicketTrackerApp:
         if not row_id or col != "#1": 
             return
 
-        values = self.tree.item(row_id, "values")
-        timestamp = values[1]  
-
-        for entry in self.entries:
-            if entry["timestamp"] == timestamp:
-                entry["done"] = not entry.get("done", False)
-                break
+        entry = self.find_entry(row_id)
+        if entry is not None:
+            self.set_done(entry, not entry.get("done", False))
+            self.mark_changed(entry)
 
         self.save_entries()
         self.populate_tree(self.entries)
 
     def search_entries(self):
+        self.cancel_archive_search()
         term = self.search_var.get().strip().lower()
         if not term:
             self.populate_tree(self.entries, sort=True)
             return
 
-        def entry_matches(entry):
-            for value in entry.values():
-                if isinstance(value, bool):
-                    val_str = "☑" if value else "☐"
-                else:
-                    val_str = str(value)
-                if term in val_str.lower():
-                    return True
-            return False
-
-        self.filtered_entries = [e for e in self.entries if entry_matches(e)]
+        self.filtered_entries = [e for e in self.entries if entry_matches(e, term)]
         self.populate_tree(self.filtered_entries, sort=False)
 
+        if self.search_archive_var.get():
+            self.start_archive_search(term)
+
+    def get_executor(self):
+        if self.executor is None:
+            workers = self.settings.get("search_workers", 0) or os.cpu_count() or 1
+            self.executor = ProcessPoolExecutor(max_workers=workers)
+        return self.executor
+
+    def start_archive_search(self, term):
+        partitions = archive_partitions()
+        if not partitions:
+            return
+
+        generation = self.search_generation
+        results = self.search_results
+
+        def on_done(future, path):
+            # Runs on the executor's callback thread; hand the result to the Tk loop via the queue.
+            if future.cancelled():
+                return
+            try:
+                results.put((generation, path, future.result()))
+            except Exception as e:
+                print(f"[Archive Search] {os.path.basename(path)} failed: {e}")
+                results.put((generation, path, []))
+
+        executor = self.get_executor()
+        for path in partitions:
+            future = executor.submit(search_partition, path, term)
+            future.add_done_callback(lambda f, p=path: on_done(f, p))
+            self.search_futures.append(future)
+
+        self.archive_pending = len(partitions)
+        self.archive_matches = 0
+        self.status_var.set(f"Searching archive... 0/{len(partitions)} months")
+        self.drain_job = self.root.after(50, self.drain_archive_results)
+
+    def drain_archive_results(self):
+        self.drain_job = None
+        if not self.search_futures:
+            return
+
+        while True:
+            try:
+                generation, path, records = self.search_results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self.search_generation:
+                continue  # result of a query the user already replaced
+
+            self.archive_pending -= 1
+            self.archive_matches += len(records)
+            count = len(self.tree.get_children())
+            for record in records:
+                if self.tree.exists(record["id"]):
+                    continue
+                self.tree.insert("", tk.END, iid=record["id"], values=entry_row_values(record), tags=("archived", "evenrow" if count % 2 == 0 else "oddrow"))
+                count += 1
+
+        self.tree.tag_configure("archived", foreground="gray40")
+        total = len(self.search_futures)
+        if self.archive_pending > 0:
+            self.status_var.set(f"Searching archive... {total - self.archive_pending}/{total} months, {self.archive_matches} archived matches")
+            self.drain_job = self.root.after(50, self.drain_archive_results)
+        else:
+            self.search_futures = []
+            self.status_var.set(f"✔ Archive search finished: {self.archive_matches} archived matches in {total} months.")
+
+    def on_search_text_changed(self, *args):
+        # Results still streaming in belong to the old query.
+        if self.search_futures:
+            self.cancel_archive_search()
+            self.update_status_bar()
+
+    def cancel_archive_search(self):
+        if self.drain_job is not None:
+            self.root.after_cancel(self.drain_job)
+            self.drain_job = None
+        self.search_generation += 1
+        for future in self.search_futures:
+            future.cancel()
+        self.search_futures = []
+
+    def archive_old_entries(self, months):
+        cutoff = datetime.now() - timedelta(days=30 * months)
+        # With sync on, tickets the team hasn't received yet stay until they're pushed.
+        unsynced = self.dirty_ids if self.settings.get("sync_enabled", False) else set()
+        old = []
+        for entry in self.entries:
+            created = parse_timestamp(entry["timestamp"])
+            if entry.get("done") and created != datetime.min and created < cutoff and entry["id"] not in unsynced:
+                old.append((created.strftime("%Y-%m"), entry))
+
+        if not old:
+            messagebox.showinfo("Archive", f"No submitted tickets older than {months} months.")
+            return
+        if not messagebox.askyesno("Archive", f"Move {len(old)} submitted tickets older than {months} months to the archive?"):
+            return
+
+        by_month = {}
+        for month, entry in old:
+            by_month.setdefault(month, []).append(entry)
+
+        os.makedirs(ARCHIVE_DIR, exist_ok=True)
+        archive_chunks = {}
+        for month, records in by_month.items():
+            path = os.path.join(ARCHIVE_DIR, f"{month}.json")
+            merged = {r["id"]: r for r in (read_partition(path) if os.path.exists(path) else [])}
+            merged.update((r["id"], r) for r in records)
+            partition = sorted(merged.values(), key=lambda r: parse_timestamp(r["timestamp"]), reverse=True)
+            write_partition(path, partition)
+            archive_chunks[ARCHIVE_BACKUP_PREFIX + month] = [dict(r) for r in partition]
+
+        archived_ids = set(e["id"] for _, e in old)
+        # Remembered so a full sync pull doesn't bring them back into the live list.
+        with open(os.path.join(ARCHIVE_DIR, ARCHIVED_IDS_FILE), "a") as f:
+            f.write("".join(f"{entry_id}\n" for entry_id in archived_ids))
+        if self.archived_ids is not None:
+            self.archived_ids |= archived_ids
+        self.dirty_ids -= archived_ids
+
+        self.entries = [e for e in self.entries if e["id"] not in archived_ids]
+        for _, entry in old:
+            self.index_live(entry, deleted=True)
+        self.backup_queue.put((archive_chunks, None))
+        self.save_entries()
+        self.populate_tree(self.entries, sort=False)
+        messagebox.showinfo("Archive", f"Archived {len(old)} tickets into {len(by_month)} monthly files.")
+
 
 
 
     def clear_search(self):
+        self.cancel_archive_search()
         self.search_var.set("")
         self.populate_tree(self.entries, sort=True)
         self.update_status_bar()
@@ -913,27 +3215,270 @@ class TicketTrackerApp:
             return  
 
         with open(filepath, "w", newline="") as csvfile:
-            fieldnames = ["timestamp", "caller", "title", "description", "additional_notes", "assignment_group", "state", "done"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=TICKET_FIELDS, extrasaction="ignore")
             writer.writeheader()
             for entry in self.entries:
                 writer.writerow(entry)
 
-        messagebox.showinfo("Exported", f"Export Complete")
+        partitions = archive_partitions() if self.search_archive_var.get() else []
+        if not partitions:
+            messagebox.showinfo("Exported", f"Export Complete")
+            return
+
+        # Each worker renders one month to its own CSV; they're appended newest month first
+        # as each is ready, so later months keep rendering while earlier ones are copied.
+        tmp_dir = tempfile.mkdtemp(prefix="ticket_export_")
+        executor = self.get_executor()
+        futures = [executor.submit(export_partition, path, os.path.join(tmp_dir, os.path.basename(path) + ".csv")) for path in partitions]
+        self.status_var.set(f"Exporting archive... 0/{len(futures)} months")
+
+        def collect():
+            try:
+                with open(filepath, "a", newline="") as out:
+                    for done, future in enumerate(futures, 1):
+                        with open(future.result(), "r", newline="") as part:
+                            shutil.copyfileobj(part, out)
+                        self.root.after(0, lambda done=done: self.status_var.set(f"Exporting archive... {done}/{len(futures)} months"))
+                self.root.after(0, lambda: messagebox.showinfo("Exported", f"Export Complete"))
+            except Exception as e:
+                self.root.after(0, lambda e=e: messagebox.showerror("Export Error", f"Failed to export the archive:\n{e}"))
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                self.root.after(0, self.update_status_bar)
+
+        threading.Thread(target=collect, daemon=True).start()
+
+    def open_reports(self):
+        win = tk.Toplevel(self.root)
+        set_window_icon(win)
+        win.title("Reports")
+        win.geometry("760x420")
+
+        period_var = tk.StringVar(value="Day")
+
+        top_frame = ttk.Frame(win, padding=5)
+        top_frame.pack(fill="x")
+
+        ttk.Label(top_frame, text="Group By:").pack(side=tk.LEFT, padx=(5, 5))
+        period_menu = ttk.Combobox(top_frame, textvariable=period_var, values=["Day", "Week"], state="readonly", width=8)
+        period_menu.pack(side=tk.LEFT)
+
+        tree_frame = ttk.Frame(win, padding=5)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+
+        scroll_y = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
+        scroll_y.grid(row=0, column=1, sticky="ns")
+
+        columns = ("Period", "Assignment Group", "State", "Tickets", "Submitted", "Avg Lag (h)")
+        report_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", yscrollcommand=scroll_y.set)
+        report_tree.grid(row=0, column=0, sticky="nsew")
+        scroll_y.config(command=report_tree.yview)
+
+        for col in columns:
+            report_tree.heading(col, text=col)
+            report_tree.column(col, width=160 if col == "Assignment Group" else 100, anchor="w" if col in columns[:3] else "center")
+
+        def refresh(event=None):
+            report_tree.delete(*report_tree.get_children())
+            for i, (bucket, group, state, tickets, submitted, avg_lag) in enumerate(self.rollups.rows(period_var.get().lower())):
+                tag = "evenrow" if i % 2 == 0 else "oddrow"
+                report_tree.insert("", tk.END, values=(bucket, group, state, tickets, submitted, "" if avg_lag is None else avg_lag), tags=(tag,))
+            report_tree.tag_configure("evenrow", background="#dcdcdc")
+            report_tree.tag_configure("oddrow", background="white")
+
+        def export_report_csv():
+            period = period_var.get().lower()
+            filepath = filedialog.asksaveasfilename(
+                parent=win,
+                defaultextension=".csv",
+                initialfile=f"Ticket_Report_{period}_{datetime.now().strftime('%Y-%m-%d')}.csv",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            )
+            if not filepath:
+                return
+            write_report_csv(filepath, self.rollups.rows(period), period)
+            messagebox.showinfo("Exported", "Report Export Complete", parent=win)
+
+        period_menu.bind("<<ComboboxSelected>>", refresh)
+        ttk.Button(top_frame, text="Refresh", command=refresh).pack(side=tk.LEFT, padx=5)
+        ttk.Button(top_frame, text="Export", command=export_report_csv).pack(side=tk.LEFT, padx=5)
+
+        refresh()
+
+    def start_ipc_server(self, sock, token):
+        def handle(conn):
+            with conn:
+                conn.settimeout(5)
+                try:
+                    message = json.loads(conn.makefile("rb").readline(65536))
+                except (OSError, ValueError):
+                    return
+                if not isinstance(message, dict) or not hmac.compare_digest(str(message.get("token", "")), token):
+                    return
+
+                # Everything that touches app state runs on the Tk thread.
+                done = threading.Event()
+                state_lock = threading.Lock()
+                state = {"started": False, "cancelled": False}
+                reply = {"ok": False}
+
+                def on_tk_thread():
+                    with state_lock:
+                        if state["cancelled"]:
+                            return
+                        state["started"] = True
+                    try:
+                        if message.get("cmd") == "show":
+                            self.bring_to_front()
+                            reply["ok"] = True
+                        elif message.get("cmd") == "quick_add":
+                            reply["id"] = self.add_quick_entry(message.get("entry") or {})
+                            reply["ok"] = reply["id"] is not None
+                        elif message.get("cmd") == "ping":
+                            reply["ok"] = True
+                    finally:
+                        done.set()
+
+                self.ipc_calls.put(on_tk_thread)
+                if not done.wait(IPC_REPLY_TIMEOUT):
+                    # Either drop the queued work, or, if it already began, wait for it so the
+                    # reply says what really happened and a retry can't add the ticket twice.
+                    with state_lock:
+                        state["cancelled"] = not state["started"]
+                    if state["cancelled"]:
+                        reply["error"] = "busy"
+                        print("[IPC] App busy or still loading; request cancelled.")
+                    else:
+                        done.wait()
+                try:
+                    conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+                except OSError:
+                    pass
+
+        def accept_loop():
+            while True:
+                try:
+                    conn, _ = sock.accept()
+                except OSError:
+                    return
+                threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+        threading.Thread(target=accept_loop, daemon=True).start()
+
+    def poll_ipc_calls(self):
+        # IPC threads never call into Tk themselves; their work is queued and run here.
+        while True:
+            try:
+                call = self.ipc_calls.get_nowait()
+            except queue.Empty:
+                break
+            call()
+        self.root.after(100, self.poll_ipc_calls)
+
+    def bring_to_front(self):
+        self.root.deiconify()
+        self.root.lift()
+        self.root.attributes("-topmost", True)
+        self.root.after(200, lambda: self.root.attributes("-topmost", False))
+        self.root.focus_force()
+
+    def add_quick_entry(self, fields):
+        title = str(fields.get("title") or "").strip()
+        if not title:
+            return None
+
+        entry = normalize_entry({
+            "timestamp": datetime.now().strftime("%m/%d/%Y %I:%M:%S %p"),
+            "caller": str(fields.get("caller") or ""),
+            "title": title,
+            "description": str(fields.get("description") or ""),
+            "assignment_group": str(fields.get("assignment_group") or ""),
+            "state": fields.get("state") if fields.get("state") in STATES else "New",
+            "modified_by": self.client_id
+        })
+        self.commit_new_entry(entry)
+
+        self.status_var.set("✔ Quick Capture Ticket Added.")
+        self.status_label.config(background="#d4edda", foreground="#155724")
+
+        def reset_status():
+            self.status_label.config(background="", foreground="black")
+            self.update_status_bar()
+
+        self.root.after(3000, reset_status)
+        return entry["id"]
 
     def start_autosave_thread(self):
         def autosave_loop():
             while True:
                 time.sleep(300)
-                self.save_entries()
+                self.root.after(0, self.autosave)  # saving may merge into the Treeview
 
         threading.Thread(target=autosave_loop, daemon=True).start()
 
     def on_close(self):
-        self.save_entries()
+        if self.save_entries():
+            self.save_rollups()
+            self.write_snapshot()
+        self.queue_backup(force=True)
+        deadline = time.time() + 5
+        while self.backup_queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.05)
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = TicketTrackerApp(root)
-    root.mainloop()
+    multiprocessing.freeze_support()  # archive search workers in the frozen exe
+    parser = argparse.ArgumentParser(description=APP_NAME)
+    commands = parser.add_subparsers(dest="command")
+
+    server_parser = commands.add_parser("sync-server", help="Host a shared team log for other Ticket Tracker instances")
+    server_parser.add_argument("--host", default="0.0.0.0")
+    server_parser.add_argument("--port", type=int, default=DEFAULT_SYNC_PORT)
+    server_parser.add_argument("--log", default=TEAM_LOG_FILE, help="Append-only team log file")
+    server_parser.add_argument("--token", help="Team token clients must send (default: generated once and kept in <log>.token)")
+
+    report_parser = commands.add_parser("report", help="Export the reporting rollups to CSV without opening the app")
+    report_parser.add_argument("output", help="CSV file to write")
+    report_parser.add_argument("--period", choices=Rollups.PERIODS, default="day")
+
+    quick_parser = commands.add_parser("quick-add", help="Hand a ticket to the running app (opens a small capture window without --title)")
+    quick_parser.add_argument("--title", default="")
+    quick_parser.add_argument("--caller", default="")
+    quick_parser.add_argument("--description", default="")
+    quick_parser.add_argument("--group", default="")
+    quick_parser.add_argument("--state", choices=STATES, default="New")
+
+    args = parser.parse_args()
+
+    if args.command == "sync-server":
+        run_sync_server(args.host, args.port, args.log, args.token)
+    elif args.command == "report":
+        export_report(args.output, args.period)
+    elif args.command == "quick-add":
+        run_quick_add(args)
+    else:
+        port = load_settings_file().get("ipc_port", DEFAULT_IPC_PORT)
+        instance_socket = claim_instance_port(port)
+        deadline = time.time() + IPC_STARTUP_WAIT
+        while instance_socket is None:
+            # Another instance holds the port (maybe still starting) or is just exiting.
+            if ipc_request({"cmd": "show"}) is not None:
+                sys.exit(0)
+            if time.time() > deadline:
+                # Never run a second copy against the same files.
+                print(f"[IPC] Port {port} is held by a program that doesn't answer; not starting.")
+                root = tk.Tk()
+                root.withdraw()
+                messagebox.showerror(APP_NAME, f"{APP_NAME} could not start: port {port} is in use by a program that isn't responding.\n\nClose it, or set a different ipc_port in settings.json.")
+                sys.exit(1)
+            time.sleep(0.5)
+            instance_socket = claim_instance_port(port)
+        ipc_token = publish_ipc_endpoint(instance_socket)
+
+        root = tk.Tk()
+        app = TicketTrackerApp(root, instance_socket, ipc_token)
+        root.mainloop()
@@ -0,0 +1,7 @@
+import os
+import sys
+import tempfile
+
+# main.py keeps its data under %APPDATA%; point it at a throwaway dir before it's imported.
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="ticket-tracker-tests-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,57 @@
+import main
+
+
+def make_entry(title, timestamp):
+    return main.normalize_entry({"title": title, "timestamp": timestamp})
+
+
+def test_archive_partitions_restore_separately_from_live_tickets(tmp_path):
+    live = make_entry("Live", "05/01/2026 10:00:00 AM")
+    archived = make_entry("Archived", "01/02/2024 10:00:00 AM")
+    store = main.BackupStore(str(tmp_path))
+    store.write_generation({"2026-05": [live], main.ARCHIVE_BACKUP_PREFIX + "2024-01": [archived]})
+
+    entries, created, archive = main.BackupStore(str(tmp_path)).restore_newest_valid()
+    assert [e["id"] for e in entries] == [live["id"]]
+    assert created
+    assert list(archive) == ["2024-01"]
+    assert [r["id"] for r in archive["2024-01"]] == [archived["id"]]
+
+
+def test_emptied_month_is_dropped_but_archive_chunks_stay(tmp_path):
+    live = make_entry("Live", "05/01/2026 10:00:00 AM")
+    archived = make_entry("Archived", "01/02/2024 10:00:00 AM")
+    store = main.BackupStore(str(tmp_path))
+    store.write_generation({"2026-05": [live], main.ARCHIVE_BACKUP_PREFIX + "2024-01": [archived]})
+    store.write_generation({"2026-05": []})
+
+    entries, _, archive = main.BackupStore(str(tmp_path)).restore_newest_valid()
+    assert entries == []
+    assert [r["id"] for r in archive["2024-01"]] == [archived["id"]]
+
+
+def test_read_archive_entries_skips_the_archived_ids_file(tmp_path):
+    archived = make_entry("Archived", "01/02/2024 10:00:00 AM")
+    main.write_partition(str(tmp_path / "2024-01.json"), [archived])
+    (tmp_path / main.ARCHIVED_IDS_FILE).write_text(archived["id"] + "\n")
+
+    assert [e["id"] for e in main.read_archive_entries(str(tmp_path))] == [archived["id"]]
+    assert main.read_archived_ids(str(tmp_path)) == {archived["id"]}
+
+
+def test_write_all_drops_months_that_no_longer_have_tickets(tmp_path):
+    kept = make_entry("Kept", "05/01/2026 10:00:00 AM")
+    deleted = make_entry("Deleted", "03/01/2026 10:00:00 AM")
+    archived = make_entry("Archived", "01/02/2024 10:00:00 AM")
+    store = main.BackupStore(str(tmp_path))
+    store.write_generation({"2026-05": [kept], "2026-03": [deleted], main.ARCHIVE_BACKUP_PREFIX + "2024-01": [archived]})
+
+    assert store.write_all([kept], [10, 1]) is not None
+    reopened = main.BackupStore(str(tmp_path))
+    assert reopened.source == [10, 1]
+    entries, _, archive = reopened.restore_newest_valid()
+    assert [e["id"] for e in entries] == [kept["id"]]
+    assert list(archive) == ["2024-01"]
+
+    # Same file again: nothing to write.
+    assert reopened.write_all([kept], [10, 1]) is None
@@ -0,0 +1,161 @@
+import types
+from tkinter import ttk
+
+import pytest
+
+import bench
+
+ROW_HEIGHT = 20
+
+
+class FakeButton(ttk.Button):
+    # Passes find_button's isinstance check without a display behind it.
+    def __init__(self, path, text):
+        self.path = path
+        self.text = text
+
+    def cget(self, option):
+        return self.text
+
+    def winfo_children(self):
+        return []
+
+    def __str__(self):
+        return self.path
+
+
+class FakeSection:
+    def __init__(self, *children):
+        self.children = children
+
+    def winfo_children(self):
+        return list(self.children)
+
+
+class FakeTree:
+    def __init__(self, rows):
+        self.rows = tuple(f"I{i:03d}" for i in range(rows))
+
+    def get_children(self):
+        return self.rows
+
+    def bbox(self, iid, column):
+        index = self.rows.index(iid)
+        return (0, index * ROW_HEIGHT, 100, ROW_HEIGHT) if index < 20 else ""
+
+    def column(self, column, option):
+        return 100
+
+    def __str__(self):
+        return ".tree"
+
+
+class FakeTk:
+    # Answers the Tcl calls EventReplay makes and keeps a Treeview-like selection.
+    def __init__(self, tree, extend_on_shift=True):
+        self.tree = tree
+        self.extend_on_shift = extend_on_shift
+        self.events = []
+        self.focused = ""
+        self.selection = ()
+        self.anchor = None
+
+    def call(self, *args):
+        if args[:2] == ("winfo", "exists"):
+            return 1
+        if args[0] == "focus":
+            if len(args) == 1:
+                return self.focused
+            self.focused = args[-1]
+            return ""
+        if args[0] == "event":
+            path, sequence, options = args[2], args[3], dict(zip(args[4::2], args[5::2]))
+            self.events.append((path, sequence, options))
+            if path == ".tree" and "ButtonPress-1" in sequence and "-y" in options:
+                index = min(options["-y"] // ROW_HEIGHT, len(self.tree.rows) - 1)
+                if sequence.startswith("<Shift-") and self.extend_on_shift and self.anchor is not None:
+                    low, high = sorted((self.anchor, index))
+                    self.selection = self.tree.rows[low:high + 1]
+                else:
+                    self.anchor = index
+                    self.selection = (self.tree.rows[index],)
+            return ""
+        if args[1] == "see":
+            return ""
+        if args[1] == "bbox":
+            return (0, self.tree.rows.index(args[2]) * ROW_HEIGHT, 100, ROW_HEIGHT)
+        if args[1] == "selection":
+            return self.selection
+        raise AssertionError(f"unexpected Tcl call {args}")
+
+    def splitlist(self, value):
+        return tuple(value)
+
+
+class FakeRoot:
+    def __init__(self, tk):
+        self.tk = tk
+        self.pending = []
+
+    def after(self, ms, func, *args):
+        self.pending.append((func, args))
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def winfo_children(self):
+        return []
+
+
+def replay(extend_on_shift=True):
+    tree = FakeTree(60)
+    app = types.SimpleNamespace(tree=tree, search_entry=".search",
+                                search_section=FakeSection(FakeButton(".clear", "✕"), FakeButton(".edit", "Edit")))
+    args = types.SimpleNamespace(toggles=2, terms=["vpn"], edit_rows=[1, 5])
+    root = FakeRoot(FakeTk(tree, extend_on_shift))
+    finished = []
+    player = bench.EventReplay(root, bench.default_scenario(app, args), 50, 0, 0, lambda: finished.append(True))
+    player.run()
+    for _ in range(10000):
+        if finished:
+            break
+        func, func_args = root.pending.pop(0)
+        func(*func_args)
+    assert finished
+    return player, root.tk
+
+
+def test_default_scenario_replays_every_step():
+    player, tk = replay()
+    assert {label: len(values) for label, values in player.latencies.items()} == {
+        "toggle_done": 2, "search": 1, "search_clear": 1, "sort_column": 2, "select_row": 2,
+        "open_edit (1 rows)": 1, "extend_selection": 1, "open_edit (5 rows)": 1, "close_edit": 2,
+    }
+    keys = [options["-keysym"] for path, sequence, options in tk.events if path == ".search"]
+    assert keys == ["v", "p", "n", "Return"]
+    assert [path for path, sequence, _ in tk.events if sequence == "<ButtonPress-1>"].count(".edit") == 2
+    assert tk.selection == tk.tree.rows[:5]
+
+
+def test_replay_stops_when_the_selection_is_not_what_the_step_expects():
+    with pytest.raises(RuntimeError, match="expected 5 selected rows, found 1"):
+        replay(extend_on_shift=False)
+
+
+def test_replay_process_never_uses_the_real_settings(monkeypatch):
+    monkeypatch.setattr(bench.main, "load_settings_file", lambda: dict(bench.main.default_settings(), sync_enabled=True))
+    written = {}
+
+    def fake_run(command, env, check, timeout):
+        with open(f"{env['APPDATA']}/{bench.main.APP_NAME}/settings.json", "r") as f:
+            written.update(bench.json.load(f))
+
+    monkeypatch.setattr(bench.subprocess, "run", fake_run)
+    args = types.SimpleNamespace(days=30, seed=1, stall_ms=50, settle_ms=0, delay_ms=0, toggles=0, terms=["vpn"],
+                                 edit_rows=[1], script=None, record=None, timeout=10)
+    bench.run_replay_process(10, args)
+    assert written["sync_enabled"] is False
+    assert written["reminders_enabled"] is False
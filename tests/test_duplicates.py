@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+import main
+
+WORDS = "printer on floor three jams every morning after the toner was replaced by facilities staff yesterday".split()
+
+
+class ExactIndex(main.DuplicateIndex):
+    # 64 one-row bands: a pair at Jaccard 0.6 is missed with probability 0.4**64, so
+    # these tests check the exact threshold rather than the luck of the LSH bands.
+    NUM_HASHES = 64
+    ROWS_PER_BAND = 1
+
+
+def ticket(text, age=timedelta(0), entry_id=None):
+    timestamp = (datetime.now() - age).strftime("%m/%d/%Y %I:%M:%S %p")
+    return main.normalize_entry({"id": entry_id, "title": text, "description": "", "timestamp": timestamp})
+
+
+def jaccard(a, b):
+    a, b = main.DuplicateIndex.shingles(a), main.DuplicateIndex.shingles(b)
+    return len(a & b) / len(a | b)
+
+
+def variants():
+    # The base text with its last k words swapped for new ones, most similar first.
+    base = " ".join(WORDS)
+    for k in range(1, len(WORDS)):
+        yield base, " ".join(WORDS[:-k] + [f"other{i}" for i in range(k)])
+
+
+def test_match_at_or_above_the_threshold_and_not_below():
+    above = below = None
+    for base, text in variants():
+        similarity = jaccard(base, text)
+        if similarity >= main.DuplicateIndex.THRESHOLD:
+            above = (base, text, similarity)
+        elif below is None:
+            below = (base, text, similarity)
+    assert above and below
+
+    for (base, text, similarity), expected in ((above, True), (below, False)):
+        index = ExactIndex()
+        entry = ticket(base)
+        index.add(entry)
+        matches = index.query(text)
+        assert bool(matches) is expected, similarity
+        if expected:
+            assert matches[0][1] == entry["id"]
+            assert abs(matches[0][0] - similarity) < 1e-9
+
+
+def test_short_texts_are_never_matched():
+    index = main.DuplicateIndex()
+    index.add(ticket("vpn down"))
+    assert index.query("vpn down") == []
+
+
+def test_tickets_outside_the_window_are_ignored():
+    index = main.DuplicateIndex(window_days=7)
+    text = " ".join(WORDS)
+    old = ticket(text, age=timedelta(days=8))
+    recent = ticket(text, age=timedelta(days=6))
+    index.add(old)
+    index.add(recent)
+    assert old["id"] not in index.items
+    assert [m[1] for m in index.query(text)] == [recent["id"]]
+
+    # Added while inside the window, then aged out: the query checks the cutoff itself.
+    created, shingles, keys, timestamp, title = index.items[recent["id"]]
+    index.items[recent["id"]] = (created - 2 * 86400, shingles, keys, timestamp, title)
+    assert index.query(text) == []
+
+
+def test_update_and_remove_keep_the_buckets_in_step():
+    index = ExactIndex()
+    first = " ".join(WORDS)
+    second = "outlook keeps asking for the password after the mailbox migration finished last night"
+    entry = ticket(first)
+    index.update(entry)
+    assert [m[1] for m in index.query(first)] == [entry["id"]]
+
+    entry["title"] = second
+    index.update(entry)
+    assert index.query(first) == []
+    assert [m[1] for m in index.query(second)] == [entry["id"]]
+
+    index.update(entry, deleted=True)
+    assert index.query(second) == []
+    assert index.items == {} and index.buckets == {}
+
+
+def test_recall_of_the_real_configuration():
+    # Pairs a little over the threshold (Jaccard ~0.7) are the hard case for the default banding.
+    index = main.DuplicateIndex()
+    pairs = []
+    for n in range(300):
+        words = [f"w{n}x{i}" for i in range(12)]
+        entry = ticket(" ".join(words))
+        index.add(entry)
+        pairs.append((entry, " ".join(words[:-2] + [f"new{n}a", f"new{n}b"])))
+    assert all(0.6 <= jaccard(entry["title"], text) < 0.75 for entry, text in pairs)
+
+    found = sum(any(m[1] == entry["id"] for m in index.query(text)) for entry, text in pairs)
+    assert found / len(pairs) >= 0.95
@@ -0,0 +1,75 @@
+import main
+
+
+def ticket(title, rev=1, **fields):
+    return main.normalize_entry(dict(fields, title=title, timestamp="05/01/2026 10:00:00 AM", rev=rev))
+
+
+def merge(local, records, base_records):
+    base = {r["id"]: main.record_fingerprint(r) for r in base_records}
+    return main.merge_file_records({e["id"]: e for e in local}, records, base)
+
+
+def edited(entry, **changes):
+    return dict(entry, **changes)
+
+
+def test_unchanged_file_needs_nothing():
+    a = ticket("A")
+    assert merge([a], [dict(a)], [a]) == ([], [], [], [], False)
+
+
+def test_ticket_added_in_the_file():
+    a, b = ticket("A"), ticket("B")
+    added, updated, removed, conflicts, needs_save = merge([a], [dict(a), b], [a])
+    assert (added, updated, removed, conflicts, needs_save) == ([b], [], [], [], False)
+
+
+def test_ticket_edited_in_the_file():
+    a = ticket("A")
+    changed = edited(a, title="A from script")
+    assert merge([a], [changed], [a]) == ([], [changed], [], [], False)
+
+
+def test_ticket_deleted_in_the_file():
+    a, b = ticket("A"), ticket("B")
+    assert merge([a, b], [dict(a)], [a, b]) == ([], [], [b], [], False)
+
+
+def test_edited_on_both_sides_higher_rev_wins():
+    a = ticket("A", rev=2)
+    mine = edited(a, title="mine", rev=3)
+    theirs = edited(a, title="theirs", rev=4)
+    added, updated, removed, conflicts, needs_save = merge([mine], [theirs], [a])
+    assert updated == [theirs]
+    assert conflicts == [(theirs, "took the file's version")]
+
+    mine = edited(a, title="mine", rev=5)
+    added, updated, removed, conflicts, needs_save = merge([mine], [theirs], [a])
+    assert (added, updated, removed) == ([], [], [])
+    assert conflicts == [(mine, "kept your version")]
+    assert needs_save
+
+
+def test_deleted_here_but_edited_in_the_file_is_restored():
+    a = ticket("A")
+    changed = edited(a, title="A from script")
+    added, updated, removed, conflicts, needs_save = merge([], [changed], [a])
+    assert added == [changed]
+    assert conflicts == [(changed, "restored: edited in the file but deleted here")]
+
+
+def test_deleted_here_and_untouched_in_the_file_stays_deleted():
+    a = ticket("A")
+    assert merge([], [dict(a)], [a]) == ([], [], [], [], True)
+
+
+def test_edited_here_but_deleted_in_the_file_is_kept_and_reported():
+    a = ticket("A")
+    mine = edited(a, title="mine", rev=2)
+    assert merge([mine], [], [a]) == ([], [], [], [(mine, "kept: edited here but deleted in the file")], True)
+
+
+def test_new_here_is_written_back():
+    a = ticket("A")
+    assert merge([a], [], []) == ([], [], [], [], True)
@@ -0,0 +1,56 @@
+import queue
+import socket
+import threading
+import time
+
+import main
+
+
+def test_instance_port_can_be_reclaimed_from_time_wait():
+    sock = main.claim_instance_port(0)
+    port = sock.getsockname()[1]
+    client = socket.create_connection(("127.0.0.1", port))
+    conn, _ = sock.accept()
+    conn.close()  # the app closes IPC connections itself, leaving them in TIME_WAIT
+    time.sleep(0.1)
+    client.close()
+    sock.close()
+
+    again = main.claim_instance_port(port)
+    try:
+        assert again is not None
+        assert main.claim_instance_port(port) is None  # still one instance at a time
+    finally:
+        again.close()
+
+
+class FakeApp:
+    def __init__(self):
+        self.ipc_calls = queue.Queue()
+        self.added = []
+
+    def add_quick_entry(self, fields):
+        self.added.append(fields)
+        return f"id{len(self.added)}"
+
+
+def test_quick_add_while_app_is_loading_is_retried_not_duplicated(monkeypatch):
+    monkeypatch.setattr(main, "IPC_REPLY_TIMEOUT", 0.3)
+    app = FakeApp()
+    sock = main.claim_instance_port(0)
+    main.TicketTrackerApp.start_ipc_server(app, sock, main.publish_ipc_endpoint(sock))
+
+    def tk_thread():
+        time.sleep(1.0)  # still loading: requests queue up and time out as "busy"
+        while True:
+            try:
+                app.ipc_calls.get(timeout=2)()
+            except queue.Empty:
+                return
+
+    threading.Thread(target=tk_thread, daemon=True).start()
+    try:
+        assert main.quick_add({"title": "Printer jam"}, 0)
+        assert app.added == [{"title": "Printer jam"}]
+    finally:
+        sock.close()
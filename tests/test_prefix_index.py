@@ -0,0 +1,53 @@
+import random
+from collections import Counter
+
+import main
+
+
+def brute_force(values, prefix, limit=8):
+    prefix = prefix.strip().lower()
+    if not prefix:
+        return []
+    spellings = {}
+    for value in values:
+        spellings.setdefault(value.lower(), Counter())[value] += 1
+    keys = [k for k in spellings if k.startswith(prefix)]
+    keys.sort(key=lambda k: (-sum(spellings[k].values()), k))
+    return [max(spellings[k], key=spellings[k].get) for k in keys[:limit]]
+
+
+def test_matches_brute_force_through_adds_edits_and_deletes():
+    rng = random.Random(7)
+    words = ["printer", "print", "password", "pass", "vpn", "vpn client", "Slow", "slow computer", "system", "software"]
+    index = main.PrefixIndex()
+    index.SCAN_LIMIT = 8  # small enough that wide nodes appear with a few hundred keys
+    values = {f"id{i}": f"{rng.choice(words)} {rng.randint(0, 60)}" for i in range(600)}
+    index.build(values.items())
+
+    prefixes = ["p", "pr", "print", "printer 1", "v", "vpn c", "s", "slow", "Sy", "pass", "x", "printer 5"]
+    for step in range(1500):
+        entry_id = f"id{rng.randint(0, 700)}"
+        if rng.random() < 0.3 and entry_id in values:
+            del values[entry_id]
+            index.update(entry_id, None)
+        else:
+            values[entry_id] = f"{rng.choice(words)} {rng.randint(0, 60)}"
+            index.update(entry_id, values[entry_id])
+        if step % 50 == 0:
+            for prefix in prefixes:
+                assert index.suggest(prefix) == brute_force(values.values(), prefix), (step, prefix)
+
+
+def test_wide_prefixes_are_precomputed():
+    index = main.PrefixIndex()
+    index.build((str(i), f"Printer not working #{i}") for i in range(2000))
+    assert "printer not working #" in index.tops
+    assert index.suggest("printer") == brute_force([f"Printer not working #{i}" for i in range(2000)], "printer")
+
+
+def test_most_used_spelling_is_shown():
+    index = main.PrefixIndex()
+    index.build([("1", "VPN issue"), ("2", "vpn issue"), ("3", "vpn issue")])
+    assert index.suggest("v") == ["vpn issue"]
+    index.update("2", "VPN issue")
+    assert index.suggest("v") == ["VPN issue"]
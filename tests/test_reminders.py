@@ -0,0 +1,111 @@
+import pytest
+
+import main
+
+
+class FakeRoot:
+    # Stands in for Tk's after()/after_cancel(); tests fire timers by hand.
+    def __init__(self):
+        self.timers = {}
+        self.next_id = 0
+        self.after_calls = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.after_calls += 1
+        self.timers[self.next_id] = (ms, func)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def armed_ms(self):
+        (ms, _), = self.timers.values()
+        return ms
+
+    def fire(self):
+        (after_id, (_, func)), = self.timers.items()
+        del self.timers[after_id]
+        func()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000000.0]
+    monkeypatch.setattr(main.time, "time", lambda: now[0])
+    return now
+
+
+def make_scheduler():
+    root = FakeRoot()
+    fired = []
+    return main.ReminderScheduler(root, fired.append), root, fired
+
+
+def test_fires_due_keys_in_order_and_rearms(clock):
+    scheduler, root, fired = make_scheduler()
+    scheduler.schedule("b", clock[0] + 20)
+    scheduler.schedule("a", clock[0] + 10)
+    assert root.armed_ms() == 10000
+
+    clock[0] += 10
+    root.fire()
+    assert fired == [["a"]]
+    assert root.armed_ms() == 10000
+
+    clock[0] += 10
+    root.fire()
+    assert fired == [["a"], ["b"]]
+    assert root.timers == {}
+
+
+def test_rescheduled_and_cancelled_keys_are_skipped(clock):
+    scheduler, root, fired = make_scheduler()
+    scheduler.schedule("moved", clock[0] + 10)
+    scheduler.schedule("cancelled", clock[0] + 10)
+    scheduler.schedule("moved", clock[0] + 30)  # the old heap item is now stale
+    scheduler.cancel("cancelled")
+
+    clock[0] += 10
+    root.fire()
+    assert fired == []
+    assert root.armed_ms() == 20000
+
+    clock[0] += 20
+    root.fire()
+    assert fired == [["moved"]]
+
+
+def test_long_waits_rearm_in_steps(clock):
+    scheduler, root, fired = make_scheduler()
+    scheduler.schedule("later", clock[0] + 3 * 3600)
+    assert root.armed_ms() == main.ReminderScheduler.MAX_WAIT_MS
+
+    clock[0] += 3600
+    root.fire()
+    assert fired == []
+    assert root.armed_ms() == main.ReminderScheduler.MAX_WAIT_MS
+
+
+def test_hold_arms_once_for_a_batch(clock):
+    scheduler, root, fired = make_scheduler()
+    scheduler.hold()
+    scheduler.clear()
+    for n in range(100):
+        # Newest first, as start_reminders walks the entries: every due time is earlier.
+        scheduler.schedule(n, clock[0] + 1000 - n)
+    assert root.after_calls == 0
+
+    scheduler.release()
+    assert root.after_calls == 1
+    assert root.armed_ms() == 901000
+
+
+def test_an_error_in_the_callback_does_not_stop_the_timer(clock):
+    root = FakeRoot()
+    scheduler = main.ReminderScheduler(root, lambda keys: 1 / 0)
+    scheduler.schedule("a", clock[0] + 1)
+    scheduler.schedule("b", clock[0] + 2)
+    clock[0] += 1
+    root.fire()
+    assert root.armed_ms() == 1000
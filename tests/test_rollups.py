@@ -0,0 +1,18 @@
+import main
+
+
+def test_rollups_round_trip_and_dirty_flag(tmp_path):
+    path = str(tmp_path / "rollups.json")
+    entry = main.normalize_entry({"title": "Printer", "timestamp": "05/01/2026 10:00:00 AM", "assignment_group": "Desk"})
+    rollups = main.Rollups()
+    assert not rollups.dirty
+    rollups.update(entry)
+    assert rollups.dirty
+    rollups.save(path, [1, 2])
+    assert not rollups.dirty
+
+    loaded = main.Rollups()
+    assert not loaded.load(path, [1, 3])  # stamped with another version of the file
+    assert loaded.load(path, [1, 2])
+    assert not loaded.dirty
+    assert loaded.rows("day") == rollups.rows("day")
@@ -0,0 +1,50 @@
+import main
+
+
+def make_entries(*timestamps):
+    return [main.normalize_entry({"title": f"Ticket {i}", "timestamp": ts}) for i, ts in enumerate(timestamps)]
+
+
+def test_snapshot_rows_are_newest_first_whatever_the_input_order(tmp_path):
+    source = str(tmp_path / "appdata.json")
+    snapshot_path = str(tmp_path / "appdata.snapshot")
+    # Ascending by raw string, the order undo used to leave behind.
+    entries = sorted(make_entries("05/01/2025 10:00:00 AM", "01/02/2026 10:00:00 AM", "12/31/2024 10:00:00 AM"), key=lambda e: e["timestamp"])
+    stamp = main.write_json_atomic(source, entries)
+    main.Snapshot.write(snapshot_path, entries, stamp)
+
+    snapshot = main.Snapshot.open(snapshot_path, source)
+    try:
+        assert [snapshot.row(i)[1][1] for i in range(len(snapshot))] == ["01/02/2026 10:00:00 AM", "05/01/2025 10:00:00 AM", "12/31/2024 10:00:00 AM"]
+        assert [e["title"] for e in snapshot.entries()] == ["Ticket 1", "Ticket 0", "Ticket 2"]
+    finally:
+        snapshot.close()
+
+
+def test_snapshot_is_rejected_when_the_json_changes(tmp_path):
+    source = str(tmp_path / "appdata.json")
+    snapshot_path = str(tmp_path / "appdata.snapshot")
+    entries = make_entries("05/01/2025 10:00:00 AM")
+    stamp = main.write_json_atomic(source, entries)
+    main.Snapshot.write(snapshot_path, entries, stamp)
+
+    main.write_json_atomic(source, entries + make_entries("06/01/2025 10:00:00 AM"))
+    assert main.Snapshot.open(snapshot_path, source) is None
+
+
+def test_write_json_atomic_stamp_matches_the_file_it_wrote(tmp_path):
+    source = str(tmp_path / "appdata.json")
+    signature, sha1 = main.write_json_atomic(source, make_entries("05/01/2025 10:00:00 AM"), indent=2)
+    assert signature == main.file_signature(source)
+    assert sha1 == main.file_sha1(source)
+
+
+def test_snapshot_stamped_with_our_save_is_rejected_after_someone_elses_write(tmp_path):
+    source = str(tmp_path / "appdata.json")
+    snapshot_path = str(tmp_path / "appdata.snapshot")
+    entries = make_entries("05/01/2025 10:00:00 AM")
+    stamp = main.write_json_atomic(source, entries)
+    # Another writer replaces the file between our save and our snapshot.
+    main.write_json_atomic(source, make_entries("06/01/2025 10:00:00 AM"))
+    main.Snapshot.write(snapshot_path, entries, stamp)
+    assert main.Snapshot.open(snapshot_path, source) is None
@@ -0,0 +1,202 @@
+import os
+import threading
+from datetime import datetime
+
+import pytest
+import requests
+
+import main
+
+TOKEN = "team-secret"
+
+
+class SimulatedClient:
+    # Mirrors TicketTrackerApp's sync bookkeeping (mark_changed / run_sync /
+    # merge_sync_result) without the Tk parts.
+    def __init__(self, url, client_id, token=TOKEN):
+        self.url = url
+        self.client_id = client_id
+        self.token = token
+        self.entries = {}
+        self.tombstones = {}
+        self.dirty_ids = set()
+        self.last_seq = 0
+
+    def mark_changed(self, entry, deleted=False):
+        entry["rev"] = entry.get("rev", 0) + 1
+        entry["modified_by"] = self.client_id
+        self.dirty_ids.add(entry["id"])
+        if deleted:
+            self.tombstones[entry["id"]] = {"id": entry["id"], "rev": entry["rev"], "modified_by": self.client_id, "deleted": True}
+        else:
+            self.tombstones.pop(entry["id"], None)
+
+    def add(self, title):
+        entry = main.normalize_entry({"title": title, "timestamp": datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")})
+        self.mark_changed(entry)
+        self.entries[entry["id"]] = entry
+        return entry["id"]
+
+    def edit(self, entry_id, **fields):
+        entry = self.entries[entry_id]
+        entry.update(fields)
+        self.mark_changed(entry)
+
+    def delete(self, entry_id):
+        self.mark_changed(self.entries.pop(entry_id), deleted=True)
+
+    def sync(self):
+        sent = main.collect_outgoing(list(self.entries.values()), self.tombstones, self.dirty_ids, full=self.last_seq == 0)
+        result = main.sync_request(self.url, self.last_seq, sent, self.token)
+        updates, removed = main.merge_sync_records(self.entries, self.tombstones, self.dirty_ids, sent, result["records"])
+        for entry_id in removed:
+            del self.entries[entry_id]
+        for entry in updates:
+            self.entries.setdefault(entry["id"], {}).update(entry)
+        self.last_seq = result["seq"]
+
+    def titles(self):
+        return sorted(e["title"] for e in self.entries.values())
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = main.make_sync_server("127.0.0.1", 0, str(tmp_path / "team_log.jsonl"), TOKEN)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def server_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def make_clients(server, count):
+    return [SimulatedClient(server_url(server), f"client-{i}") for i in range(count)]
+
+
+def sync_all(clients, rounds=2):
+    for _ in range(rounds):
+        for client in clients:
+            client.sync()
+
+
+def test_clients_converge(server):
+    a, b, c = make_clients(server, 3)
+    a.add("VPN issue")
+    a.add("Printer not working")
+    b.add("Password reset")
+    sync_all([a, b, c])
+
+    assert a.titles() == b.titles() == c.titles() == ["Password reset", "Printer not working", "VPN issue"]
+    assert not a.dirty_ids and not b.dirty_ids
+
+
+def test_only_dirty_records_are_sent_after_first_sync(server):
+    a, b = make_clients(server, 2)
+    for i in range(5):
+        a.add(f"Ticket {i}")
+    sync_all([a, b])
+
+    first = next(iter(a.entries))
+    a.edit(first, state="Resolved")
+    assert main.collect_outgoing(list(a.entries.values()), a.tombstones, a.dirty_ids, full=False) == [a.entries[first]]
+    sync_all([a, b])
+    assert b.entries[first]["state"] == "Resolved"
+
+
+def test_concurrent_edits_resolve_the_same_everywhere(server):
+    a, b, c = make_clients(server, 3)
+    ticket = a.add("Slow computer")
+    sync_all([a, b, c])
+
+    a.edit(ticket, state="In Progress")
+    a.edit(ticket, state="On Hold")
+    b.edit(ticket, state="Resolved")
+    sync_all([b, a, c])
+
+    assert {client.entries[ticket]["state"] for client in (a, b, c)} == {"On Hold"}
+
+
+def test_delete_propagates_and_is_not_resurrected(server):
+    a, b, c = make_clients(server, 3)
+    ticket = a.add("System crash")
+    sync_all([a, b, c])
+
+    b.delete(ticket)
+    sync_all([b, a, c])
+    assert all(ticket not in client.entries for client in (a, b, c))
+
+    # A client joining later does a full pull and must not see it either.
+    late = SimulatedClient(server_url(server), "late")
+    late.sync()
+    assert ticket not in late.entries
+
+
+def test_changes_made_offline_are_pushed_later(server):
+    a, b = make_clients(server, 2)
+    kept = a.add("Software install")
+    dropped = a.add("Cannot access email")
+    sync_all([a, b])
+
+    # Edits while b isn't syncing stay dirty until the next round.
+    a.edit(kept, title="Software install (Visio)")
+    a.delete(dropped)
+    assert a.dirty_ids == {kept, dropped}
+    sync_all([a, b])
+    assert b.titles() == ["Software install (Visio)"]
+
+
+def test_server_rejects_bad_requests(server):
+    url = server_url(server) + "/sync"
+    auth = {"Authorization": f"Bearer {TOKEN}"}
+
+    assert requests.post(url, json={"since": 0, "records": []}, timeout=5).status_code == 401
+    assert requests.post(url, json={"since": 0, "records": []}, headers={"Authorization": "Bearer wrong"}, timeout=5).status_code == 401
+    assert requests.post(url, json={"since": None}, headers=auth, timeout=5).status_code == 400
+    assert requests.post(url, json={"since": 0, "records": 5}, headers=auth, timeout=5).status_code == 400
+
+    response = requests.post(url, json={"since": 0, "records": [{"id": "b", "rev": 1}, {"id": "c", "rev": 1, "deleted": True}]}, headers=auth, timeout=5)
+    assert response.status_code == 200
+    assert [r["id"] for r in response.json()["records"]] == ["c"]
+
+    # Wrongly typed versions are dropped, not stored, so they can't break later pushes of the same id.
+    bad = [{"id": "c", "rev": 2, "modified_by": 5, "deleted": True},
+           {"id": "c", "rev": True, "modified_by": None, "deleted": True},
+           {"id": "d", "rev": True, "modified_by": None, "deleted": True},
+           {"id": "e", "rev": "2", "modified_by": "x", "deleted": True}]
+    response = requests.post(url, json={"since": 0, "records": bad}, headers=auth, timeout=5)
+    assert response.status_code == 200
+    assert [(r["id"], r["rev"]) for r in response.json()["records"]] == [("c", 1)]
+
+    response = requests.post(url, json={"since": 0, "records": [{"id": "c", "rev": 3, "modified_by": "x", "deleted": True}]}, headers=auth, timeout=5)
+    assert [(r["id"], r["rev"]) for r in response.json()["records"]] == [("c", 3)]
+
+
+def test_log_skips_records_with_bad_types(tmp_path):
+    log = tmp_path / "team_log.jsonl"
+    log.write_text('{"id": "a", "rev": true, "modified_by": null, "deleted": true, "seq": 1}\n'
+                   '{"id": "b", "rev": 1, "modified_by": "x", "deleted": true, "seq": 2}\n')
+    store = main.SyncStore(str(log))
+    assert list(store.records) == ["b"]
+    store.sync(0, [{"id": "a", "rev": 1, "modified_by": "x", "deleted": True}])
+    assert list(store.records) == ["b", "a"]
+
+
+def test_log_survives_server_restart(server, tmp_path):
+    a, = make_clients(server, 1)
+    ticket = a.add("VPN issue")
+    a.sync()
+
+    store = main.SyncStore(str(tmp_path / "team_log.jsonl"))
+    assert store.seq == a.last_seq
+    assert store.records[ticket]["title"] == "VPN issue"
+
+
+def test_sync_token_is_kept_next_to_log(tmp_path):
+    log_path = str(tmp_path / "team_log.jsonl")
+    token = main.load_sync_token(log_path)
+    assert token and main.load_sync_token(log_path) == token
+    assert os.path.exists(log_path + ".token")